@@ -7,6 +7,7 @@ Performs sanity checks on the extracted type information XML.
 
 import argparse
 import json
+import sys
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Any
@@ -30,6 +31,14 @@ def validate_xml_structure(xml_file: Path) -> dict[str, Any]:
         "issues": [],
     }
 
+    # Accumulate counts in locals and store them in results once at the end
+    issues: list[str] = results["issues"]
+    type_count = 0
+    types_with_description = 0
+    types_with_examples = 0
+    types_with_remarks = 0
+    total_examples = 0
+
     try:
         tree = ET.parse(xml_file)
         results["valid_xml"] = True
@@ -40,41 +49,49 @@ def validate_xml_structure(xml_file: Path) -> dict[str, Any]:
 
         # Count and validate types
         for type_elem in root.findall("Type"):
-            results["type_count"] += 1
+            type_count += 1
 
             # Check required fields
             name = type_elem.find("Name")
             if name is None or not name.text:
-                results["issues"].append(f"Type at position {results['type_count']} missing name")
+                issues.append(f"Type at position {type_count} missing name")
 
             assembly = type_elem.find("Assembly")
             if assembly is None or not assembly.text:
-                results["issues"].append(f"Type {name.text if name is not None else 'Unknown'} missing assembly")
+                issues.append(f"Type {name.text if name is not None else 'Unknown'} missing assembly")
 
             namespace = type_elem.find("Namespace")
             if namespace is None or not namespace.text:
-                results["issues"].append(f"Type {name.text if name is not None else 'Unknown'} missing namespace")
+                issues.append(f"Type {name.text if name is not None else 'Unknown'} missing namespace")
 
             # Check optional fields
             description = type_elem.find("Description")
             if description is not None and description.text:
-                results["types_with_description"] += 1
+                types_with_description += 1
 
             examples = type_elem.find("Examples")
             if examples is not None:
                 example_count = len(examples.findall("Example"))
                 if example_count > 0:
-                    results["types_with_examples"] += 1
-                    results["total_examples"] += example_count
+                    types_with_examples += 1
+                    total_examples += example_count
 
             remarks = type_elem.find("Remarks")
             if remarks is not None and remarks.text:
-                results["types_with_remarks"] += 1
+                types_with_remarks += 1
 
     except ET.ParseError as e:
-        results["issues"].append(f"XML parsing error: {e}")
+        issues.append(f"XML parsing error: {e}")
     except Exception as e:
-        results["issues"].append(f"Validation error: {e}")
+        issues.append(f"Validation error: {e}")
+
+    results.update(
+        type_count=type_count,
+        types_with_description=types_with_description,
+        types_with_examples=types_with_examples,
+        types_with_remarks=types_with_remarks,
+        total_examples=total_examples,
+    )
 
     return results
 
@@ -230,4 +247,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    exit(main())
+    sys.exit(main())
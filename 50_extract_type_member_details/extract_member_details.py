@@ -7,25 +7,92 @@ and extracts member details (parameters, return values, remarks) into an XML for
 """
 
 import argparse
+import functools
+import io
 import json
+import multiprocessing
+import os
 import re
 import sys
-import xml.etree.ElementTree as ET
+from collections.abc import Iterator
+from contextlib import ExitStack
 from html.parser import HTMLParser
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
+from xml.sax.saxutils import escape
 
 # Add parent directory to path for shared module imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from shared.extraction_utils import (
-    extract_member_name_from_filename,
     extract_namespace_from_filename,
-    is_member_file,
-    prettify_xml,
+    is_member_file_name,
 )
 from shared.xmldoc_links import convert_links_to_see_refs
 
+# Use orjson for writing the summary when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parameter, return and remarks text repeats across many members (about a quarter
+# of all sections), so link conversion results are memoized
+convert_links_cached = functools.lru_cache(maxsize=65536)(convert_links_to_see_refs)
+
+# minidom also escapes double quotes in text nodes
+_QUOTE_ENTITY = {'"': "&quot;"}
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Section started by each known h1/h4 header text; None ends the current section
+_H1_SECTIONS: dict[str, str | None] = {
+    ".NET Syntax": "syntax",
+    "Remarks": "remarks",
+    "Example": None,
+    "Examples": None,
+    "See Also": None,
+    "Availability": None,
+}
+_H4_SECTIONS = {"Parameters": "parameters", "Return Value": "return", "Property Value": "return"}
+
+# Punctuation allowed in a C# return type besides word characters, e.g. "System.Collections.Generic.List<int>[]"
+_TYPE_NAME_PUNCTUATION = str.maketrans("", "", "_.[]<>,")
+
+
+def parse_page_title(text: str) -> tuple[str, str] | None:
+    """
+    Split a page title into member and type names.
+
+    Parses: "InsertCavity3 Method (IAssemblyDoc)" -> ("InsertCavity3", "IAssemblyDoc")
+    """
+    head, paren, rest = text.partition("(")
+    type_name, close, _ = rest.partition(")")
+    if not close or not type_name or "\n" in type_name:
+        return None
+
+    words = head.rsplit(None, 1)
+    if len(words) != 2 or words[1] not in ("Method", "Property") or not head[-1].isspace() or "\n" in words[0]:
+        return None
+
+    return words[0].strip(), type_name.strip()
+
+
+def start_tag_fragments(tag: str, attrs: list[tuple[str, str | None]]) -> list[str]:
+    """
+    Split a start tag into raw fragments, leaving all concatenation to the final join.
+
+    Tags are rebuilt from the parsed name and attributes rather than copied from the
+    source (get_starttag_text): HTMLParser lowercases names, unescapes attribute
+    values and the rebuilt form always double-quotes them, which is the shape the
+    anchor pattern in convert_links_to_see_refs expects.
+    """
+    fragments = ["<", tag]
+    for name, value in attrs:
+        fragments.extend((" ", name, '="', value or "", '"'))
+    fragments.append(">")
+    return fragments
+
 
 class MemberDetailsExtractor(HTMLParser):
     """HTML parser to extract member details from SolidWorks API documentation."""
@@ -77,7 +144,9 @@ class MemberDetailsExtractor(HTMLParser):
         self.remarks_depth: int = 0
 
     def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        attrs_dict = dict(attrs)
+        # Only span/div/table attributes are inspected, so skip building the
+        # attribute dict for every other tag on the page
+        attrs_dict = dict(attrs) if tag in ("span", "div", "table") else {}
 
         # Detect page title
         if tag == "span" and attrs_dict.get("id") == "pagetitle":
@@ -104,7 +173,7 @@ class MemberDetailsExtractor(HTMLParser):
             return
 
         # Track when we're in a syntax table
-        if self.in_cs_syntax and tag == "table" and "syntaxtable" in attrs_dict.get("class", ""):
+        if self.in_cs_syntax and tag == "table" and "syntaxtable" in (attrs_dict.get("class") or ""):
             self.in_syntax_table = True
             self.syntax_depth = 0
             return
@@ -113,23 +182,19 @@ class MemberDetailsExtractor(HTMLParser):
         if self.in_syntax_table and tag == "pre":
             self.syntax_depth += 1
 
+        # Collectors that record this tag; at most one is normally active, but
+        # the fragments are built once even if several sections overlap
+        targets = []
+
         # Collect all HTML tags in description section
         if self.in_description and not self.in_pagetitle:
-            attrs_str = ""
-            if attrs:
-                attrs_str = " " + " ".join([f'{k}="{v}"' for k, v in attrs])
-            self.description_parts.append(f"<{tag}{attrs_str}>")
+            targets.append(self.description_parts)
 
         # Detect parameters section (dl/dt/dd structure)
         if self.in_parameters_section:
             if tag == "dt":
                 # Save previous parameter if any
-                if self.current_param_name:
-                    param_desc = "".join(self.current_param_desc_parts).strip()
-                    param_desc = convert_links_to_see_refs(param_desc)
-                    self.parameters.append({"Name": self.current_param_name, "Description": param_desc})
-                    self.current_param_name = ""
-                    self.current_param_desc_parts = []
+                self._flush_param()
 
                 self.in_param_dt = True
             elif tag == "dd":
@@ -137,26 +202,22 @@ class MemberDetailsExtractor(HTMLParser):
             else:
                 # Collect HTML tags in parameter description
                 if self.in_param_dd:
-                    attrs_str = ""
-                    if attrs:
-                        attrs_str = " " + " ".join([f'{k}="{v}"' for k, v in attrs])
-                    self.current_param_desc_parts.append(f"<{tag}{attrs_str}>")
+                    targets.append(self.current_param_desc_parts)
 
         # Collect all HTML tags in return value section
         if self.in_return_section and not self.in_h4:
             self.return_depth += 1
-            attrs_str = ""
-            if attrs:
-                attrs_str = " " + " ".join([f'{k}="{v}"' for k, v in attrs])
-            self.return_parts.append(f"<{tag}{attrs_str}>")
+            targets.append(self.return_parts)
 
         # Collect all HTML tags in remarks section
         if self.in_remarks_section and not self.in_h1:
             self.remarks_depth += 1
-            attrs_str = ""
-            if attrs:
-                attrs_str = " " + " ".join([f'{k}="{v}"' for k, v in attrs])
-            self.remarks_parts.append(f"<{tag}{attrs_str}>")
+            targets.append(self.remarks_parts)
+
+        if targets:
+            fragments = start_tag_fragments(tag, attrs)
+            for parts in targets:
+                parts.extend(fragments)
 
     def handle_endtag(self, tag: str) -> None:
         if tag == "span" and self.in_pagetitle:
@@ -165,9 +226,12 @@ class MemberDetailsExtractor(HTMLParser):
             self.in_description = True
             return
 
+        # Collectors that record this closing tag
+        targets = []
+
         # Track closing tags in description section
         if self.in_description and not self.in_pagetitle:
-            self.description_parts.append(f"</{tag}>")
+            targets.append(self.description_parts)
 
         # Close h1 tag - might signal end of section header
         if tag == "h1":
@@ -193,21 +257,16 @@ class MemberDetailsExtractor(HTMLParser):
             self.in_param_dd = False
         elif tag == "dl" and self.in_parameters_section:
             # Save last parameter if any
-            if self.current_param_name:
-                param_desc = "".join(self.current_param_desc_parts).strip()
-                param_desc = convert_links_to_see_refs(param_desc)
-                self.parameters.append({"Name": self.current_param_name, "Description": param_desc})
-                self.current_param_name = ""
-                self.current_param_desc_parts = []
+            self._flush_param()
         else:
             # Collect closing HTML tags in parameter description
             if self.in_param_dd:
-                self.current_param_desc_parts.append(f"</{tag}>")
+                targets.append(self.current_param_desc_parts)
 
         # Track closing tags in return value section
         if self.in_return_section and not self.in_h4:
             self.return_depth -= 1
-            self.return_parts.append(f"</{tag}>")
+            targets.append(self.return_parts)
 
             # If we're back to depth 0 and see a closing div, end return section
             if self.return_depth == 0 and tag == "div":
@@ -216,12 +275,17 @@ class MemberDetailsExtractor(HTMLParser):
         # Track closing tags in remarks section
         if self.in_remarks_section and not self.in_h1:
             self.remarks_depth -= 1
-            self.remarks_parts.append(f"</{tag}>")
+            targets.append(self.remarks_parts)
 
             # If we're back to depth 0 and see a closing div, end remarks
             if self.remarks_depth == 0 and tag == "div":
                 self.in_remarks_section = False
 
+        if targets:
+            fragments = ("</", tag, ">")
+            for parts in targets:
+                parts.extend(fragments)
+
     def handle_data(self, data: str) -> None:
         text = data.strip()
 
@@ -229,43 +293,31 @@ class MemberDetailsExtractor(HTMLParser):
         # Format: "MemberName Method/Property (TypeName)"
         if self.in_pagetitle and text:
             # Parse: "InsertCavity3 Method (IAssemblyDoc)"
-            match = re.match(r"(.+?)\s+(Method|Property)\s+\((.+?)\)", text)
-            if match:
-                self.member_name = match.group(1).strip()
-                self.type_name = match.group(3).strip()
+            names = parse_page_title(text)
+            if names:
+                self.member_name, self.type_name = names
 
         # Capture description (text between pagetitle and first h1)
         if self.in_description and data and not self.in_pagetitle:
             self.description_parts.append(data)
 
         # Detect section headers (only when inside h1 tags)
-        if self.in_h1:
-            if text == ".NET Syntax":
-                self.current_section = "syntax"
-                self.in_syntax_section = True
-                self.in_parameters_section = False
-                self.in_return_section = False
-                self.in_remarks_section = False
-            elif text == "Remarks":
-                self.current_section = "remarks"
-                self.in_syntax_section = False
-                self.in_parameters_section = False
-                self.in_return_section = False
-                self.in_remarks_section = True
-            elif text in ["Example", "Examples", "See Also", "Availability"]:
-                # End current section - turn off all section flags
-                self.in_syntax_section = False
-                self.in_parameters_section = False
-                self.in_return_section = False
-                self.in_remarks_section = False
-                self.current_section = None
+        if self.in_h1 and text in _H1_SECTIONS:
+            # Any known header ends the previous section; a None section turns off all flags
+            section = _H1_SECTIONS[text]
+            self.current_section = section
+            self.in_syntax_section = section == "syntax"
+            self.in_parameters_section = False
+            self.in_return_section = False
+            self.in_remarks_section = section == "remarks"
 
         # Detect "Parameters", "Return Value", and "Property Value" headers (h4 tags)
         if self.in_h4:
-            if text == "Parameters":
+            section = _H4_SECTIONS.get(text)
+            if section == "parameters":
                 self.in_parameters_section = True
                 self.in_return_section = False
-            elif text == "Return Value" or text == "Property Value":
+            elif section == "return":
                 self.in_parameters_section = False
                 self.in_return_section = True
                 self.return_depth = 0
@@ -274,9 +326,10 @@ class MemberDetailsExtractor(HTMLParser):
         if self.in_syntax_table and self.syntax_depth > 0 and data:
             self.signature_parts.append(data)
 
-        # Collect parameter name (from dt tag, remove <i> wrapper)
+        # Collect parameter name (from dt tag, remove <i> wrapper); the same few
+        # names (Index, Count, ...) recur across thousands of members
         if self.in_param_dt and data:
-            self.current_param_name = data.strip()
+            self.current_param_name = sys.intern(data.strip())
 
         # Collect parameter description (from dd tag)
         if self.in_param_dd and data:
@@ -290,10 +343,21 @@ class MemberDetailsExtractor(HTMLParser):
         if self.in_remarks_section and data and not self.in_h1:
             self.remarks_parts.append(data)
 
+    def _flush_param(self) -> None:
+        """Save the parameter collected so far and reset for the next one."""
+        if not self.current_param_name:
+            return
+
+        param_desc = "".join(self.current_param_desc_parts).strip()
+        param_desc = convert_links_cached(param_desc)
+        self.parameters.append({"Name": self.current_param_name, "Description": param_desc})
+        self.current_param_name = ""
+        self.current_param_desc_parts = []
+
     def get_description(self) -> str:
         """Get the cleaned description text (with link conversion)."""
         description_html = "".join(self.description_parts).strip()
-        description_html = convert_links_to_see_refs(description_html)
+        description_html = convert_links_cached(description_html)
         return description_html
 
     def get_signature(self) -> str:
@@ -305,38 +369,49 @@ class MemberDetailsExtractor(HTMLParser):
         """
         signature = "".join(self.signature_parts).strip()
         # Clean up extra whitespace
-        signature = re.sub(r"\s+", " ", signature)
+        signature = _WHITESPACE_RE.sub(" ", signature)
 
         # Remove return type from the signature
         # Pattern: "ReturnType MethodName(...)" -> "MethodName(...)"
-        # Match everything up to and including the first space before the method name
-        match = re.match(r"^[\w\.\[\]<>,\s]+?\s+(.+)$", signature)
-        if match:
-            signature = match.group(1)
+        # Whitespace is collapsed, so the return type is everything before the first space
+        return_type, space, rest = signature.partition(" ")
+        if space and rest:
+            type_chars = return_type.translate(_TYPE_NAME_PUNCTUATION)
+            if not type_chars or type_chars.isalnum():
+                signature = rest
 
         return signature
 
     def get_return_value(self) -> str:
         """Get the cleaned return value description."""
         return_html = "".join(self.return_parts).strip()
-        return_html = convert_links_to_see_refs(return_html)
+        return_html = convert_links_cached(return_html)
         return return_html
 
     def get_remarks(self) -> str:
         """Get the remarks content (may include HTML)."""
         remarks_html = "".join(self.remarks_parts).strip()
-        remarks_html = convert_links_to_see_refs(remarks_html)
+        remarks_html = convert_links_cached(remarks_html)
         return remarks_html
 
 
 def extract_member_details_from_file(html_file: Path) -> dict[str, Any] | None:
     """Extract member details from a single HTML file."""
-    parser = MemberDetailsExtractor()
-
     try:
-        with open(html_file, encoding="utf-8") as f:
-            content = f.read()
-            parser.feed(content)
+        # Decode in one call instead of through a text-mode file wrapper
+        raw = html_file.read_bytes()
+        content = raw.decode("utf-8")
+
+        # Pages without a title span can never yield a member name, so skip parsing them
+        if raw.find(b"pagetitle") < 0:
+            print(f"Warning: Could not extract member name from {html_file}")
+            return None
+
+        if "\r" in content:
+            # Same line endings as a text-mode read
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        parser = MemberDetailsExtractor()
+        parser.feed(content)
     except Exception as e:
         print(f"Error parsing {html_file}: {e}")
         return None
@@ -348,9 +423,6 @@ def extract_member_details_from_file(html_file: Path) -> dict[str, Any] | None:
     # Extract namespace, assembly, and type name from file path
     assembly, namespace, type_name = extract_namespace_from_filename(html_file)
 
-    # Verify member name from filename matches
-    filename_member = extract_member_name_from_filename(html_file)
-
     return {
         "Assembly": assembly,
         "Type": f"{namespace}.{type_name}" if namespace and type_name else None,
@@ -364,66 +436,97 @@ def extract_member_details_from_file(html_file: Path) -> dict[str, Any] | None:
     }
 
 
-def create_xml_output(members: list[dict[str, Any]]) -> str:
-    """Create XML output from extracted member information."""
-    root = ET.Element("Members")
+def xml_text(tag: str, text: str | None, indent: str) -> str:
+    """Format a single-line text element the way minidom's pretty printer does."""
+    if not text:
+        return f"{indent}<{tag}/>\n"
+    return f"{indent}<{tag}>{escape(text, _QUOTE_ENTITY)}</{tag}>\n"
+
+
+def xml_cdata(tag: str, text: str, indent: str) -> str:
+    """Format an element whose text is wrapped in a CDATA section to preserve XMLDoc markup."""
+    # A literal "]]>" cannot appear inside CDATA, so split it across two sections
+    text = text.replace("]]>", "]]]]><![CDATA[>")
+    return f"{indent}<{tag}><![CDATA[{text}]]></{tag}>\n"
+
+
+def iter_html_files(root: str | os.PathLike[str]) -> Iterator[os.DirEntry[str]]:
+    """
+    Yield directory entries for .html files under root in Path.rglob order.
+
+    Entries are yielded instead of Paths so callers can filter on the name
+    before creating a Path for the files they keep.
+    """
+    with os.scandir(root) as it:
+        entries = list(it)
+
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            subdirs.append(entry.path)
+        elif entry.name.endswith(".html"):
+            yield entry
+
+    for subdir in subdirs:
+        yield from iter_html_files(subdir)
+
+
+def write_xml_output(members: list[dict[str, Any]], out: TextIO) -> None:
+    """
+    Write XML output for extracted member information to a text stream.
+
+    Fragments are written member by member rather than building the document in
+    memory; the layout matches the previous prettify_xml output.
+    """
+    if not members:
+        out.write('<?xml version="1.0" ?>\n<Members/>\n')
+        return
+
+    out.write('<?xml version="1.0" ?>\n<Members>\n')
 
     for member_info in members:
-        member_elem = ET.SubElement(root, "Member")
+        out.write("    <Member>\n")
 
-        # Add assembly
         if member_info.get("Assembly"):
-            assembly_elem = ET.SubElement(member_elem, "Assembly")
-            assembly_elem.text = member_info["Assembly"]
+            out.write(xml_text("Assembly", member_info["Assembly"], "        "))
 
-        # Add type
         if member_info.get("Type"):
-            type_elem = ET.SubElement(member_elem, "Type")
-            type_elem.text = member_info["Type"]
+            out.write(xml_text("Type", member_info["Type"], "        "))
 
-        # Add member name
-        name_elem = ET.SubElement(member_elem, "Name")
-        name_elem.text = member_info["Name"]
+        out.write(xml_text("Name", member_info["Name"], "        "))
 
-        # Add signature
         if member_info.get("Signature"):
-            sig_elem = ET.SubElement(member_elem, "Signature")
-            sig_elem.text = member_info["Signature"]
+            out.write(xml_text("Signature", member_info["Signature"], "        "))
 
-        # Add description (wrap in CDATA to preserve any XMLDoc markup)
         if member_info.get("Description"):
-            desc_elem = ET.SubElement(member_elem, "Description")
-            desc_elem.text = member_info["Description"]
-            desc_elem.set("__cdata__", "true")
+            out.write(xml_cdata("Description", member_info["Description"], "        "))
 
-        # Add parameters
         if member_info.get("Parameters"):
-            params_elem = ET.SubElement(member_elem, "Parameters")
+            out.write("        <Parameters>\n")
             for param in member_info["Parameters"]:
-                param_elem = ET.SubElement(params_elem, "Parameter")
-
-                param_name = ET.SubElement(param_elem, "Name")
-                param_name.text = param["Name"]
-
+                out.write("            <Parameter>\n")
+                out.write(xml_text("Name", param["Name"], "                "))
                 if param.get("Description"):
-                    param_desc = ET.SubElement(param_elem, "Description")
-                    param_desc.text = param["Description"]
-                    param_desc.set("__cdata__", "true")
+                    out.write(xml_cdata("Description", param["Description"], "                "))
+                out.write("            </Parameter>\n")
+            out.write("        </Parameters>\n")
 
-        # Add return value (wrap in CDATA to preserve any XMLDoc markup)
         if member_info.get("Returns"):
-            returns_elem = ET.SubElement(member_elem, "Returns")
-            returns_elem.text = member_info["Returns"]
-            returns_elem.set("__cdata__", "true")
+            out.write(xml_cdata("Returns", member_info["Returns"], "        "))
 
-        # Add remarks (wrap in CDATA to preserve any XMLDoc markup)
         if member_info.get("Remarks"):
-            remarks_elem = ET.SubElement(member_elem, "Remarks")
-            remarks_elem.text = member_info["Remarks"]
-            remarks_elem.set("__cdata__", "true")
+            out.write(xml_cdata("Remarks", member_info["Remarks"], "        "))
+
+        out.write("    </Member>\n")
 
-    # Pretty print the XML with CDATA sections
-    return prettify_xml(root)
+    out.write("</Members>\n")
+
+
+def create_xml_output(members: list[dict[str, Any]]) -> str:
+    """Create XML output from extracted member information."""
+    buffer = io.StringIO()
+    write_xml_output(members, buffer)
+    return buffer.getvalue()
 
 
 def main() -> int:
@@ -440,6 +543,12 @@ def main() -> int:
         default=Path("50_extract_type_member_details/metadata"),
         help="Directory to save output files",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes for parsing HTML files (default: CPU count)",
+    )
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
 
     args = parser.parse_args()
@@ -448,8 +557,8 @@ def main() -> int:
     args.output_dir.mkdir(parents=True, exist_ok=True)
 
     # Find all member HTML files
-    all_html_files = list(args.input_dir.rglob("*.html"))
-    member_files = [f for f in all_html_files if is_member_file(f)]
+    all_html_files = list(iter_html_files(args.input_dir))
+    member_files = [Path(entry.path) for entry in all_html_files if is_member_file_name(entry.name)]
 
     if not member_files:
         print(f"No member files found in {args.input_dir}")
@@ -461,26 +570,39 @@ def main() -> int:
     members = []
     errors = []
 
-    for html_file in member_files:
-        if args.verbose:
-            print(f"Processing {html_file.name}...")
-
-        member_info = extract_member_details_from_file(html_file)
-        if member_info:
-            members.append(member_info)
+    # Parse files across worker processes; imap keeps results in input order and
+    # hands each one back as soon as it is ready, so they are consumed while
+    # later files are still being parsed. The pool is terminated if the loop raises
+    with ExitStack() as stack:
+        pool = stack.enter_context(multiprocessing.Pool(args.workers)) if args.workers > 1 else None
+        results: Iterator[dict[str, Any] | None]
+        if pool is not None:
+            results = pool.imap(extract_member_details_from_file, member_files, chunksize=64)
         else:
-            errors.append(str(html_file))
+            results = map(extract_member_details_from_file, member_files)
+
+        for html_file, member_info in zip(member_files, results, strict=True):
+            if args.verbose:
+                print(f"Processing {html_file.name}...")
+
+            if member_info:
+                members.append(member_info)
+            else:
+                errors.append(str(html_file))
 
-    # Sort members by type and name for consistent output
-    members.sort(key=lambda x: (str(x.get("Type", "")), str(x.get("Name", ""))))
+        if pool is not None:
+            # Let workers exit cleanly so their buffered warnings are flushed
+            pool.close()
+            pool.join()
 
-    # Generate XML output
-    xml_output = create_xml_output(members)
+    # Sort members by type and name for consistent output; every member dict has
+    # both keys and Name is always a string, only Type can be None
+    members.sort(key=lambda x: (str(x["Type"]), x["Name"]))
 
-    # Save XML file
+    # Stream XML output straight to the file
     xml_file = args.output_dir / "api_member_details.xml"
-    with open(xml_file, "w", encoding="utf-8") as f:
-        f.write(xml_output)
+    with open(xml_file, "w", encoding="utf-8", buffering=1 << 20) as f:
+        write_xml_output(members, f)
 
     print("\nExtraction complete!")
     print(f"  Members extracted: {len(members)}")
@@ -505,8 +627,12 @@ def main() -> int:
     }
 
     summary_file = args.output_dir / "extraction_summary.json"
-    with open(summary_file, "w", encoding="utf-8") as f:
-        json.dump(summary, f, indent=2)
+    if orjson is not None:
+        with open(summary_file, "wb") as summary_out:
+            summary_out.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+    else:
+        with open(summary_file, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
 
     print(f"  Members with parameters: {members_with_params}")
     print(f"  Members with return values: {members_with_returns}")
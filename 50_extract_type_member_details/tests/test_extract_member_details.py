@@ -14,7 +14,12 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from shared.extraction_utils import extract_member_name_from_filename, extract_namespace_from_filename, is_member_file
+from shared.extraction_utils import (
+    extract_member_name_from_filename,
+    extract_namespace_from_filename,
+    is_member_file,
+    is_member_file_name,
+)
 
 # Import from the parent directory (50_extract_type_member_details)
 from extract_member_details import MemberDetailsExtractor, create_xml_output, extract_member_details_from_file
@@ -43,6 +48,12 @@ class TestMemberFiltering:
         assert not is_member_file(Path("FunctionalCategories.html"))
         assert not is_member_file(Path("help_list.html"))
 
+    def test_is_member_file_name(self):
+        """Test that bare file names are checked the same way as paths."""
+        assert is_member_file_name("SolidWorks.Interop.sldworks~SolidWorks.Interop.sldworks.IModelDoc2~GetTitle.html")
+        assert not is_member_file_name("SolidWorks.Interop.sldworks~SolidWorks.Interop.sldworks.IModelDoc2_hash.html")
+        assert not is_member_file_name("help_list.html")
+
 
 class TestFilenameExtraction:
     """Test filename parsing functions."""
@@ -419,3 +430,10 @@ class TestIntegration:
         assert "Error as defined by" in member_info["Returns"]
         assert "-1 indicates an unknown error" in member_info["Returns"]
         assert "IFaultEntity::Count" in member_info["Remarks"]
+
+    def test_extract_from_file_without_pagetitle(self, tmp_path):
+        """Test that pages without a title span are rejected."""
+        html_file = tmp_path / "SolidWorks.Interop.sldworks~SolidWorks.Interop.sldworks.IModelDoc2~NoTitle.html"
+        html_file.write_text("<html><body><h1>Remarks</h1><p>No title here.</p></body></html>")
+
+        assert extract_member_details_from_file(html_file) is None
@@ -13,40 +13,52 @@ import argparse
 import json
 import sys
 import xml.etree.ElementTree as ET
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+# Use orjson for reading the summary when it is installed
+json_loads: Callable[[bytes], Any]
+try:
+    import orjson
 
-def validate_xml_structure(xml_file: Path) -> tuple[bool, list[str]]:
-    """
-    Validate that the XML file is well-formed and has the expected structure.
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
-    Returns:
-        (is_valid, error_messages)
-    """
-    errors = []
+# Member fields that must have text, and their statistics key
+REQUIRED_FIELDS = {
+    "Assembly": "members_with_assembly",
+    "Type": "members_with_type",
+    "Name": "members_with_name",
+}
 
-    try:
-        tree = ET.parse(xml_file)
-        root = tree.getroot()
-    except ET.ParseError as e:
-        errors.append(f"XML parsing error: {e}")
-        return False, errors
+# Optional member fields that are counted when they have text, and their statistics key
+OPTIONAL_TEXT_FIELDS = {
+    "Signature": "members_with_signature",
+    "Description": "members_with_description",
+    "Returns": "members_with_returns",
+    "Remarks": "members_with_remarks",
+}
 
-    if root.tag != "Members":
-        errors.append(f"Root element should be 'Members', got '{root.tag}'")
-
-    return len(errors) == 0, errors
+# Member error messages kept for reporting; the rest are only counted
+MAX_ERRORS = 100
 
 
-def validate_member_elements(xml_file: Path) -> tuple[bool, list[str], dict[str, Any]]:
+def validate_member_elements(xml_file: Path) -> tuple[list[str], list[str], dict[str, Any]]:
     """
-    Validate that member elements have required fields.
+    Validate the XML structure and that member elements have required fields.
+
+    The file is streamed with iterparse in a single pass, so each member is
+    checked and dropped as soon as it has been read instead of holding the
+    whole document in memory. Only the first MAX_ERRORS member errors are
+    kept; statistics["member_errors"] has the total count.
 
     Returns:
-        (is_valid, error_messages, statistics)
+        (structure_errors, member_errors, statistics)
     """
-    errors = []
+    structure_errors = []
+    errors: list[str] = []
     stats: dict[str, Any] = {
         "total_members": 0,
         "members_with_assembly": 0,
@@ -58,67 +70,83 @@ def validate_member_elements(xml_file: Path) -> tuple[bool, list[str], dict[str,
         "members_with_returns": 0,
         "members_with_remarks": 0,
         "duplicate_members": [],
+        "member_errors": 0,
     }
 
-    tree = ET.parse(xml_file)
-    root = tree.getroot()
-
     seen_members = set()
 
-    for member in root.findall("Member"):
-        stats["total_members"] += 1
-
-        # Check required fields
-        assembly = member.find("Assembly")
-        type_elem = member.find("Type")
-        name = member.find("Name")
-
-        if assembly is not None and assembly.text:
-            stats["members_with_assembly"] += 1
-        else:
-            errors.append(f"Member {stats['total_members']} missing Assembly")
-
-        if type_elem is not None and type_elem.text:
-            stats["members_with_type"] += 1
-        else:
-            errors.append(f"Member {stats['total_members']} missing Type")
-
-        if name is not None and name.text:
-            stats["members_with_name"] += 1
-        else:
-            errors.append(f"Member {stats['total_members']} missing Name")
-
-        # Check for duplicates (same Type + Name)
-        if type_elem is not None and name is not None and type_elem.text and name.text:
-            member_key = (type_elem.text, name.text)
-            if member_key in seen_members:
-                stats["duplicate_members"].append(f"{type_elem.text}.{name.text}")
-            else:
-                seen_members.add(member_key)
-
-        # Check optional but expected fields
-        if member.find("Signature") is not None and member.find("Signature").text:
-            stats["members_with_signature"] += 1
-
-        if member.find("Description") is not None and member.find("Description").text:
-            stats["members_with_description"] += 1
-
-        if member.find("Parameters") is not None:
-            stats["members_with_parameters"] += 1
-
-        if member.find("Returns") is not None and member.find("Returns").text:
-            stats["members_with_returns"] += 1
-
-        if member.find("Remarks") is not None and member.find("Remarks").text:
-            stats["members_with_remarks"] += 1
+    try:
+        context = ET.iterparse(xml_file, events=("start", "end"))
+
+        # The first start event is the root element
+        _, root = next(context)
+        if root.tag != "Members":
+            structure_errors.append(f"Root element should be 'Members', got '{root.tag}'")
+
+        depth = 1
+        for event, member in context:
+            if event == "start":
+                depth += 1
+                continue
+
+            depth -= 1
+            # Only direct children of the root are members
+            if depth != 1 or member.tag != "Member":
+                continue
+
+            stats["total_members"] += 1
+
+            # Index the children once instead of scanning them for every field;
+            # reversed so the first child with a tag wins, as with find()
+            children = {child.tag: child for child in reversed(member)}
+
+            # Check required fields
+            for tag, stat_key in REQUIRED_FIELDS.items():
+                child = children.get(tag)
+                if child is not None and child.text:
+                    stats[stat_key] += 1
+                else:
+                    # Count every error but only keep the first MAX_ERRORS messages
+                    stats["member_errors"] += 1
+                    if len(errors) < MAX_ERRORS:
+                        errors.append(f"Member {stats['total_members']} missing {tag}")
+
+            # Check for duplicates (same Type + Name)
+            type_elem = children.get("Type")
+            name = children.get("Name")
+            if type_elem is not None and name is not None and type_elem.text and name.text:
+                member_key = (type_elem.text, name.text)
+                if member_key in seen_members:
+                    stats["duplicate_members"].append(f"{type_elem.text}.{name.text}")
+                else:
+                    seen_members.add(member_key)
+
+            # Check optional but expected fields
+            for tag, stat_key in OPTIONAL_TEXT_FIELDS.items():
+                child = children.get(tag)
+                if child is not None and child.text:
+                    stats[stat_key] += 1
+
+            # Only count members with at least one <Parameter>, not an empty <Parameters/>
+            parameters = children.get("Parameters")
+            if parameters is not None and len(parameters):
+                stats["members_with_parameters"] += 1
+
+            # Drop the checked member so the tree never grows past one member
+            root.remove(member)
+    except ET.ParseError as e:
+        structure_errors.append(f"XML parsing error: {e}")
 
-    return len(errors) == 0, errors, stats
+    return structure_errors, errors, stats
 
 
-def validate_against_summary(xml_file: Path, summary_file: Path) -> tuple[bool, list[str]]:
+def validate_against_summary(member_count: int, summary_file: Path) -> tuple[bool, list[str]]:
     """
     Validate that XML member count matches the summary metadata.
 
+    The member count comes from the validate_member_elements pass, so the XML
+    is not parsed again here.
+
     Returns:
         (is_valid, error_messages)
     """
@@ -128,12 +156,7 @@ def validate_against_summary(xml_file: Path, summary_file: Path) -> tuple[bool,
         errors.append(f"Summary file not found: {summary_file}")
         return False, errors
 
-    with open(summary_file) as f:
-        summary = json.load(f)
-
-    tree = ET.parse(xml_file)
-    root = tree.getroot()
-    member_count = len(root.findall("Member"))
+    summary = json_loads(summary_file.read_bytes())
 
     expected_count = summary.get("members_extracted", 0)
     if member_count != expected_count:
@@ -167,28 +190,27 @@ def main() -> int:
 
     all_valid = True
 
-    # 1. Validate XML structure
+    # 1. Validate XML structure (checked in the same pass as the member elements)
     print("\n1. Checking XML structure...")
-    is_valid, errors = validate_xml_structure(xml_file)
-    if is_valid:
+    structure_errors, errors, stats = validate_member_elements(xml_file)
+    if not structure_errors:
         print("   ✅ XML is well-formed")
     else:
         print("   ❌ XML structure validation failed:")
-        for error in errors:
+        for error in structure_errors:
             print(f"      - {error}")
         all_valid = False
 
     # 2. Validate member elements
     print("\n2. Checking member elements...")
-    is_valid, errors, stats = validate_member_elements(xml_file)
-    if is_valid:
+    if not errors:
         print("   ✅ All members have required fields")
     else:
         print("   ❌ Member validation failed:")
         for error in errors[:10]:  # Show first 10 errors
             print(f"      - {error}")
-        if len(errors) > 10:
-            print(f"      ... and {len(errors) - 10} more errors")
+        if stats["member_errors"] > 10:
+            print(f"      ... and {stats['member_errors'] - 10} more errors")
         all_valid = False
 
     # Show statistics
@@ -213,7 +235,7 @@ def main() -> int:
 
     # 4. Validate against summary
     print("\n4. Checking against summary metadata...")
-    is_valid, errors = validate_against_summary(xml_file, summary_file)
+    is_valid, errors = validate_against_summary(stats["total_members"], summary_file)
     if is_valid:
         print("   ✅ Member count matches summary")
     else:
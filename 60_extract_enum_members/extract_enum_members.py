@@ -7,7 +7,11 @@ into an XML format separate from the type definitions.
 """
 
 import argparse
+import functools
+import hashlib
 import json
+import multiprocessing
+import os
 import re
 import sys
 import xml.dom.minidom as minidom
@@ -21,6 +25,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from shared.xmldoc_links import convert_links_to_see_refs
 
+# Part of every parse cache key; bump it whenever EnumMemberExtractor's output changes
+_PARSE_CACHE_VERSION = 1
+
 
 class EnumMemberExtractor(HTMLParser):
     """HTML parser to extract enum member information from SolidWorks API documentation."""
@@ -42,7 +49,9 @@ class EnumMemberExtractor(HTMLParser):
         self.member_desc_depth: int = 0
 
     def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        attrs_dict = dict(attrs)
+        # Only span/table/td attributes are inspected, so skip building the
+        # attribute dict for every other tag on the page
+        attrs_dict = dict(attrs) if tag in ("span", "table", "td") else {}
 
         # Detect page title
         if tag == "span" and attrs_dict.get("id") == "pagetitle":
@@ -50,7 +59,9 @@ class EnumMemberExtractor(HTMLParser):
             return
 
         # Detect members table (enum members)
-        is_enum_members_table = self.in_members_section and tag == "table" and attrs_dict.get("class") == "FilteredItemListTable"
+        is_enum_members_table = (
+            self.in_members_section and tag == "table" and attrs_dict.get("class") == "FilteredItemListTable"
+        )
         if is_enum_members_table:
             self.in_members_table = True
             return
@@ -142,6 +153,28 @@ class EnumMemberExtractor(HTMLParser):
             self.current_member_desc_parts.append(data)
 
 
+# Splits a type filename into assembly, namespace and type name while stripping
+# the hash suffixes and extensions in the same match. Example filenames:
+#   SolidWorks.Interop.sldworks~SolidWorks.Interop.sldworks.IAdvancedHoleFeatureData_84c83747.html
+#   SolidWorks.Interop.swconst~SolidWorks.Interop.swconst.swTangencyType_e_359c36b2_359c36b2.htmll.html
+_TYPE_FILENAME_RE = re.compile(
+    r"""
+    ^(?:
+        (?P<assembly>[^~]*)~                            # Assembly~
+        (?:(?P<namespace>.*?)\.(?!html?l?(?:\.|$)))?    # Namespace. (dot before the type name)
+        (?P<type_name>[^.]*?)                           # TypeName
+      | (?P<bare_name>.*?)                              # No tilde: whole name is the type name
+    )
+    (?:_[0-9a-f]{8})*                                   # Hash suffixes
+    (?:\.html?l?)*$                                     # .html, .htmll.html, .htm extensions
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+# Special pages that share the type filename pattern but are not types
+_SPECIAL_PREFIXES = ("functionalcategories", "releasenotes", "help_list")
+
+
 def extract_namespace_from_filename(html_file: Path) -> tuple[str, str, str]:
     """
     Extract namespace and assembly from the file path.
@@ -149,43 +182,17 @@ def extract_namespace_from_filename(html_file: Path) -> tuple[str, str, str]:
     Returns:
         tuple[str, str, str]: (assembly, namespace, type_name)
     """
-    # Example filename format:
-    # SolidWorks.Interop.sldworks~SolidWorks.Interop.sldworks.IAdvancedHoleFeatureData_84c83747.html
-    # Or with double extension: SolidWorks.Interop.swconst~SolidWorks.Interop.swconst.swTangencyType_e_359c36b2_359c36b2.htmll.html
-    filename = html_file.name
-
-    # Remove all extensions (.html, .htmll.html, etc.)
-    while "." in filename and any(filename.endswith(ext) for ext in [".html", ".htmll", ".htm"]):
-        filename = filename.rsplit(".", 1)[0]
-
-    # Remove hash suffixes (underscore followed by hex digits)
-    # Keep removing until we don't have hash pattern
-    while re.search(r"_[0-9a-f]{8}$", filename):
-        filename = filename.rsplit("_", 1)[0]
-
-    name_part = filename
-
-    # Split by tilde to get assembly and rest
-    if "~" in name_part:
-        assembly_part, rest = name_part.split("~", 1)
-        assembly = assembly_part
-
-        # The rest contains namespace.type
-        # The namespace is everything up to the last dot
-        if "." in rest:
-            parts = rest.rsplit(".", 1)
-            namespace = parts[0]
-            type_name = parts[1]
-        else:
-            namespace = assembly
-            type_name = rest
-    else:
+    match = _TYPE_FILENAME_RE.match(html_file.name)
+    if match is None:
+        return "", "", html_file.name
+
+    assembly = match["assembly"]
+    if assembly is None:
         # No tilde separator - use filename as type name
-        assembly = ""
-        namespace = ""
-        type_name = name_part
+        return "", "", match["bare_name"]
 
-    return assembly, namespace, type_name
+    # Without a dot in the type path the namespace is the assembly
+    return assembly, match["namespace"] or assembly, match["type_name"]
 
 
 def is_enum_file(html_file: Path) -> bool:
@@ -197,17 +204,11 @@ def is_enum_file(html_file: Path) -> bool:
     """
     filename = html_file.name.lower()
 
-    # Exclude members and namespace files
-    if "_members_" in filename or "_namespace_" in filename:
-        return False
-
-    # Exclude special files
-    special_prefixes = ["functionalcategories", "releasenotes", "help_list"]
-    if any(filename.startswith(prefix) for prefix in special_prefixes):
+    # Cheap substring rejects before running the regex
+    if "~" not in filename or "_members_" in filename or "_namespace_" in filename:
         return False
 
-    # Must have tilde separator (indicating it's a type file)
-    if "~" not in filename:
+    if filename.startswith(_SPECIAL_PREFIXES):
         return False
 
     # Check if it's an enum by looking at the type name
@@ -215,34 +216,66 @@ def is_enum_file(html_file: Path) -> bool:
     return type_name.endswith("_e")
 
 
-def extract_enum_members_from_file(html_file: Path) -> dict | None:
-    """Extract enum members from a single HTML file."""
+def _parse_enum_html(content: str, cache_dir: Path | None) -> tuple[str | None, list[dict[str, str]]]:
+    """
+    Parse enum HTML content into (type_name, enum_members).
+
+    When cache_dir is set, results are stored as JSON keyed by a hash of the
+    parser version and HTML content so unchanged files are not re-parsed on
+    later runs. An unreadable cache entry is treated as a miss.
+    """
+    cache_file = None
+    if cache_dir is not None:
+        key = hashlib.sha256(f"{_PARSE_CACHE_VERSION}\0{content}".encode()).hexdigest()[:16]
+        cache_file = cache_dir / f"{key}.json"
+        try:
+            with open(cache_file, encoding="utf-8") as f:
+                cached = json.load(f)
+            return cached["type_name"], cached["enum_members"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
     parser = EnumMemberExtractor()
+    parser.feed(content)
+
+    if cache_file is not None:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a per-process temp file and rename, so an interrupted run
+        # never leaves a truncated entry behind
+        temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump({"type_name": parser.type_name, "enum_members": parser.enum_members}, f)
+        os.replace(temp_file, cache_file)
 
+    return parser.type_name, parser.enum_members
+
+
+def extract_enum_members_from_file(html_file: Path, cache_dir: Path | None = None) -> dict | None:
+    """Extract enum members from a single HTML file, optionally using a parse cache."""
     try:
         with open(html_file, encoding="utf-8") as f:
             content = f.read()
-            parser.feed(content)
+        type_name, enum_members = _parse_enum_html(content, cache_dir)
     except Exception as e:
         print(f"Error parsing {html_file}: {e}")
         return None
 
-    if not parser.type_name:
+    if not type_name:
         print(f"Warning: Could not extract type name from {html_file}")
         return None
 
     # Only return if we found members
-    if not parser.enum_members:
+    if not enum_members:
         return None
 
     # Extract namespace and assembly from file path
-    assembly, namespace, type_name = extract_namespace_from_filename(html_file)
+    assembly, namespace, _ = extract_namespace_from_filename(html_file)
 
     return {
-        "Name": parser.type_name,
+        "Name": type_name,
         "Assembly": assembly,
         "Namespace": namespace,
-        "Members": parser.enum_members,
+        "Members": enum_members,
         "SourceFile": str(html_file),
     }
 
@@ -325,6 +358,18 @@ def main() -> int:
         default=Path("60_extract_enum_members/metadata/enum_members.xml"),
         help="Output XML file (default: 60_extract_enum_members/metadata/enum_members.xml)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes for parsing HTML files (default: CPU count)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Directory for caching parse results by HTML content hash (default: no cache)",
+    )
     parser.add_argument("--verbose", action="store_true", help="Print verbose output")
 
     args = parser.parse_args()
@@ -349,11 +394,18 @@ def main() -> int:
     enums: list[dict[str, Any]] = []
     errors: list[str] = []
 
-    for html_file in enum_files:
+    # Parse files across worker processes; imap keeps results in input order
+    extract_file = functools.partial(extract_enum_members_from_file, cache_dir=args.cache_dir)
+    if args.workers > 1:
+        with multiprocessing.Pool(args.workers) as pool:
+            results = list(pool.imap(extract_file, enum_files, chunksize=64))
+    else:
+        results = [extract_file(html_file) for html_file in enum_files]
+
+    for html_file, enum_info in zip(enum_files, results, strict=True):
         if args.verbose:
             print(f"Processing {html_file.name}...")
 
-        enum_info = extract_enum_members_from_file(html_file)
         if enum_info:
             enums.append(enum_info)
         else:
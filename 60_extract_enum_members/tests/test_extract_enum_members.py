@@ -3,10 +3,21 @@
 Unit tests for enum member extraction.
 """
 
+import json
+import tempfile
 import unittest
+import xml.etree.ElementTree as ET
 from pathlib import Path
+from unittest import mock
 
-from extract_enum_members import EnumMemberExtractor, create_xml_output, extract_namespace_from_filename, is_enum_file
+from extract_enum_members import (
+    EnumMemberExtractor,
+    _parse_enum_html,
+    create_xml_output,
+    extract_enum_members_from_file,
+    extract_namespace_from_filename,
+    is_enum_file,
+)
 
 
 class TestEnumMemberExtractor(unittest.TestCase):
@@ -98,6 +109,74 @@ class TestEnumMemberExtractor(unittest.TestCase):
         self.assertEqual(len(parser.enum_members), 0)
 
 
+class TestParseCache(unittest.TestCase):
+    """Test caching parse results by HTML content hash."""
+
+    HTML = """
+    <span id="pagetitle">swTest_e Enumeration</span>
+    <h1>Members</h1>
+    <table class="FilteredItemListTable">
+        <tr><th>Member</th><th>Description</th></tr>
+        <tr>
+            <td class="MemberNameCell"><strong>swTestMember</strong></td>
+            <td class="DescriptionCell">1 = Test</td>
+        </tr>
+    </table>
+    """
+
+    def test_cache_is_written_and_reused(self) -> None:
+        """Test that a second extraction reads the cached result instead of the HTML."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            html_file = Path(temp_dir) / "SolidWorks.Interop.swconst~SolidWorks.Interop.swconst.swTest_e_84c83747.html"
+            html_file.write_text(self.HTML, encoding="utf-8")
+            cache_dir = Path(temp_dir) / "cache"
+
+            first = extract_enum_members_from_file(html_file, cache_dir=cache_dir)
+            self.assertIsNotNone(first)
+            self.assertEqual(first["Members"], [{"Name": "swTestMember", "Description": "1 = Test"}])
+
+            cache_files = list(cache_dir.glob("*.json"))
+            self.assertEqual(len(cache_files), 1)
+
+            # Tamper with the cache entry to prove it is used for unchanged content
+            cached = json.loads(cache_files[0].read_text(encoding="utf-8"))
+            cached["enum_members"][0]["Name"] = "swCachedMember"
+            cache_files[0].write_text(json.dumps(cached), encoding="utf-8")
+
+            second = extract_enum_members_from_file(html_file, cache_dir=cache_dir)
+            self.assertIsNotNone(second)
+            self.assertEqual(second["Members"][0]["Name"], "swCachedMember")
+            self.assertEqual(second["Assembly"], "SolidWorks.Interop.swconst")
+
+    def test_truncated_cache_entry_is_a_miss(self) -> None:
+        """Test that an unreadable cache entry is re-parsed and rewritten."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            html_file = Path(temp_dir) / "SolidWorks.Interop.swconst~SolidWorks.Interop.swconst.swTest_e_84c83747.html"
+            html_file.write_text(self.HTML, encoding="utf-8")
+            cache_dir = Path(temp_dir) / "cache"
+
+            extract_enum_members_from_file(html_file, cache_dir=cache_dir)
+            cache_file = next(cache_dir.glob("*.json"))
+            cache_file.write_text('{"type_name": "swTe', encoding="utf-8")
+
+            result = extract_enum_members_from_file(html_file, cache_dir=cache_dir)
+            self.assertIsNotNone(result)
+            self.assertEqual(result["Members"], [{"Name": "swTestMember", "Description": "1 = Test"}])
+            self.assertEqual(json.loads(cache_file.read_text(encoding="utf-8"))["type_name"], "swTest_e")
+            self.assertEqual(list(cache_dir.glob("*.tmp")), [])
+
+    def test_cache_key_includes_parser_version(self) -> None:
+        """Test that bumping the parser version ignores entries from older versions."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_dir = Path(temp_dir) / "cache"
+
+            _parse_enum_html(self.HTML, cache_dir)
+            with mock.patch("extract_enum_members._PARSE_CACHE_VERSION", 2):
+                _parse_enum_html(self.HTML, cache_dir)
+
+            self.assertEqual(len(list(cache_dir.glob("*.json"))), 2)
+
+
 class TestFileFiltering(unittest.TestCase):
     """Test filtering enum files from other files."""
 
@@ -157,17 +236,24 @@ class TestXMLOutput(unittest.TestCase):
 
         xml_output = create_xml_output(enums)
 
+        root = ET.fromstring(xml_output)
+
         # Verify structure
-        self.assertIn("<EnumMembers>", xml_output)
-        self.assertIn("<Enum>", xml_output)
-        self.assertIn("<Name>swTest_e</Name>", xml_output)
-        self.assertIn("<Assembly>Test.Assembly</Assembly>", xml_output)
-        self.assertIn("<Namespace>Test.Namespace</Namespace>", xml_output)
-        self.assertIn("<Members>", xml_output)
-        self.assertIn("<Member>", xml_output)
-        self.assertIn("<Name>swMember1</Name>", xml_output)
+        self.assertEqual(root.tag, "EnumMembers")
+        enum_elems = root.findall("Enum")
+        self.assertEqual(len(enum_elems), 1)
+        enum_elem = enum_elems[0]
+        self.assertEqual(enum_elem.findtext("Name"), "swTest_e")
+        self.assertEqual(enum_elem.findtext("Assembly"), "Test.Assembly")
+        self.assertEqual(enum_elem.findtext("Namespace"), "Test.Namespace")
+
+        members = enum_elem.findall("Members/Member")
+        self.assertEqual([m.findtext("Name") for m in members], ["swMember1", "swMember2"])
+        self.assertEqual(members[0].findtext("Description"), "Description 1")
+        self.assertEqual(members[1].findtext("Description"), 'Description with <see cref="Test.Type">link</see>')
+
+        # Descriptions are emitted as CDATA so the XMLDoc markup stays unescaped
         self.assertIn("<Description><![CDATA[Description 1]]></Description>", xml_output)
-        self.assertIn('<see cref="Test.Type">link</see>', xml_output)
 
 
 if __name__ == "__main__":
@@ -11,6 +11,9 @@ Usage:
 """
 
 import argparse
+import hashlib
+import json
+import os
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
@@ -25,16 +28,108 @@ def extract_urls_from_xml(xml_file: Path) -> set[str]:
     Returns:
         Set of unique example URLs
     """
-    tree = ET.parse(xml_file)
-    root = tree.getroot()
-
     urls = set()
 
-    # Find all <Url> elements within <Example> elements
-    for example in root.findall(".//Example/Url"):
-        url = example.text
-        if url:
-            urls.add(url.strip())
+    # Stream the file instead of building the whole tree; the first start event is the root
+    context = ET.iterparse(xml_file, events=("start", "end"))
+    _, root = next(context)
+
+    # Tags of the currently open elements, to find <Url> elements within <Example> elements
+    open_tags = [root.tag]
+
+    for event, elem in context:
+        if event == "start":
+            open_tags.append(elem.tag)
+            continue
+
+        open_tags.pop()
+        if elem.tag == "Url" and len(open_tags) > 1 and open_tags[-1] == "Example":
+            url = elem.text
+            if url:
+                urls.add(url.strip())
+        elif len(open_tags) == 1:
+            # Drop each finished <Type> so only one is held in memory at a time
+            root.remove(elem)
+
+    return urls
+
+
+def write_urls(urls: set[str], output_file: Path) -> None:
+    """
+    Write URLs to a file, one per line in sorted order.
+
+    The file is written next to its final location and renamed into place,
+    so readers never see a partially written list.
+
+    Args:
+        urls: URLs to write
+        output_file: Path to the URL list file
+    """
+    tmp_file = output_file.with_name(output_file.name + ".tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        for url in sorted(urls):
+            f.write(f"{url}\n")
+    os.replace(tmp_file, output_file)
+
+
+def _cache_stamp(xml_file: Path, urls_data: bytes) -> dict[str, int | str]:
+    """
+    Describe the XML a URL list was extracted from, and the list itself.
+
+    Args:
+        xml_file: Path to the api_types.xml file
+        urls_data: Contents of the URL list file
+
+    Returns:
+        XML size and modification time, and a hash of the URL list
+    """
+    stat = xml_file.stat()
+    return {
+        "xml_size": stat.st_size,
+        "xml_mtime_ns": stat.st_mtime_ns,
+        "urls_sha256": hashlib.sha256(urls_data).hexdigest(),
+    }
+
+
+def load_example_urls(xml_file: Path, cache_file: Path) -> set[str]:
+    """
+    Load unique example URLs, reusing a URL list written by a previous call.
+
+    example_urls.txt is derived data. A stamp file next to it records the size and
+    modification time of the XML it came from, plus a hash of the list. The cache is
+    only used when all of them still match. If the XML changed, or the list was
+    edited or partially copied, the URLs are extracted from the XML again and the
+    cache is rewritten.
+
+    Args:
+        xml_file: Path to the api_types.xml file
+        cache_file: Path to the cached URL list (e.g. example_urls.txt)
+
+    Returns:
+        Set of unique, non-empty example URLs
+    """
+    stamp_file = cache_file.with_name(cache_file.name + ".stamp")
+
+    try:
+        urls_data = cache_file.read_bytes()
+        with open(stamp_file, encoding="utf-8") as f:
+            stamp = json.load(f)
+    except (OSError, ValueError):
+        stamp = None
+
+    if stamp is not None and stamp == _cache_stamp(xml_file, urls_data):
+        return {line.strip() for line in urls_data.decode("utf-8").splitlines() if line.strip()}
+
+    urls = extract_urls_from_xml(xml_file)
+    urls.discard("")
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    write_urls(urls, cache_file)
+
+    # Written after the list, so an interrupted run leaves a stamp that no longer matches
+    tmp_file = stamp_file.with_name(stamp_file.name + ".tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(_cache_stamp(xml_file, cache_file.read_bytes()), f)
+    os.replace(tmp_file, stamp_file)
 
     return urls
 
@@ -80,9 +175,7 @@ def main() -> None:
     args.output.parent.mkdir(parents=True, exist_ok=True)
 
     # Write URLs to output file
-    with open(args.output, "w", encoding="utf-8") as f:
-        for url in sorted(urls):
-            f.write(f"{url}\n")
+    write_urls(urls, args.output)
 
     print(f"URLs written to: {args.output}")
 
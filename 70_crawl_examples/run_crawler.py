@@ -29,7 +29,9 @@ from scrapy.utils.project import get_project_settings
 # Add the scrapy project to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from extract_example_urls import load_example_urls
 from solidworks_scraper.spiders.examples_spider import ExamplesSpider
+from validate_crawl import scan_html_files
 
 
 def setup_environment() -> tuple[Path, Path, Path]:
@@ -53,11 +55,12 @@ def clear_previous_crawl(metadata_dir: Path, output_dir: Path) -> None:
     """Clear metadata and HTML files from previous crawl"""
     import shutil
 
-    # Clear metadata files (except example_urls.txt which is source data)
+    # Clear metadata files (except the cached example URL list and its stamp,
+    # derived from api_types.xml and checked against it by load_example_urls)
     metadata_path = Path(metadata_dir)
     if metadata_path.exists():
         for file in metadata_path.glob("*"):
-            if file.is_file() and file.name != "example_urls.txt":
+            if file.is_file() and file.name not in {"example_urls.txt", "example_urls.txt.stamp"}:
                 file.unlink()
         print(f"Cleared metadata files from {metadata_dir}")
 
@@ -69,8 +72,8 @@ def clear_previous_crawl(metadata_dir: Path, output_dir: Path) -> None:
         print(f"Cleared HTML files from {html_dir}")
 
 
-def ensure_xml_file(project_dir: Path) -> bool:
-    """Ensure the source XML file exists"""
+def ensure_xml_file(project_dir: Path) -> set[str] | None:
+    """Ensure the source XML file exists and return its example URLs, or None on failure"""
     # XML file should be in the parent directory (project root)
     xml_file = project_dir.parent / "40_extract_type_details" / "metadata" / "api_types.xml"
 
@@ -78,26 +81,19 @@ def ensure_xml_file(project_dir: Path) -> bool:
         print("\n[ERROR] api_types.xml not found!")
         print(f"Expected location: {xml_file}")
         print("Please run Phase 3 (extract_type_info) first.")
-        return False
+        return None
 
-    # Try to parse and count URLs
+    # Count URLs, reusing metadata/example_urls.txt while its stamp still matches
+    # api_types.xml's size and mtime and the list's own hash
     try:
-        import xml.etree.ElementTree as ET
-        tree = ET.parse(xml_file)
-        root = tree.getroot()
-
-        urls = set()
-        for example in root.findall(".//Example/Url"):
-            url = example.text
-            if url and url.strip():
-                urls.add(url.strip())
+        urls = load_example_urls(xml_file, project_dir / "metadata" / "example_urls.txt")
 
         print(f"Found {len(urls)} unique example URLs to crawl")
-        return True
+        return urls
 
     except Exception as e:
         print(f"\n[ERROR] Failed to parse api_types.xml: {e}")
-        return False
+        return None
 
 
 def get_crawl_settings(
@@ -124,6 +120,21 @@ def get_crawl_settings(
     return settings
 
 
+def count_lines(path: Path) -> int:
+    """Count the lines in a file by scanning raw bytes, without decoding them"""
+    count = 0
+    last_chunk = b""
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            count += chunk.count(b"\n")
+            last_chunk = chunk
+
+    # A final line without a trailing newline still counts as a line
+    if last_chunk and not last_chunk.endswith(b"\n"):
+        count += 1
+    return count
+
+
 def validate_crawl(metadata_dir: Path) -> bool:
     """Validate the crawl results"""
     print("\n" + "=" * 50)
@@ -137,16 +148,14 @@ def validate_crawl(metadata_dir: Path) -> bool:
     # Count crawled URLs
     crawled_count = 0
     if urls_file.exists():
-        with open(urls_file) as f:
-            crawled_count = sum(1 for _ in f)
+        crawled_count = count_lines(urls_file)
 
     print(f"Pages crawled: {crawled_count}")
 
     # Count errors
     error_count = 0
     if errors_file.exists():
-        with open(errors_file) as f:
-            error_count = sum(1 for _ in f)
+        error_count = count_lines(errors_file)
 
     print(f"Errors encountered: {error_count}")
 
@@ -194,7 +203,7 @@ def print_summary(metadata_dir: Path) -> None:
     # Count saved files (HTML)
     html_dir = metadata_dir.parent / "output" / "html"
     if html_dir.exists():
-        html_count = sum(1 for _ in html_dir.rglob("*.html"))
+        html_count = sum(1 for _ in scan_html_files(html_dir))
         print(f"HTML files saved: {html_count}")
     else:
         print("HTML files saved: 0")
@@ -243,7 +252,8 @@ def main() -> None:
             sys.exit(1)
 
     # Ensure XML source file exists
-    if not ensure_xml_file(project_dir):
+    example_urls = ensure_xml_file(project_dir)
+    if example_urls is None:
         sys.exit(1)
 
     try:
@@ -263,8 +273,8 @@ def main() -> None:
         # Create and configure the crawler process
         process = CrawlerProcess(settings)
 
-        # Add the spider to crawl
-        process.crawl(ExamplesSpider)
+        # Add the spider to crawl, handing over the URLs so it does not re-read the XML
+        process.crawl(ExamplesSpider, example_urls=example_urls)
 
         # Start the crawling process
         print("Starting crawl... (Press Ctrl+C to stop)\n")
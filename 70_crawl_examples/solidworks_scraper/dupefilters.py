@@ -0,0 +1,83 @@
+"""
+Duplicate request filters for the SolidWorks API examples crawler.
+"""
+
+import math
+from pathlib import Path
+from typing import Any
+
+from scrapy.crawler import Crawler
+from scrapy.dupefilters import RFPDupeFilter
+from scrapy.http import Request
+from scrapy.utils.job import job_dir
+
+
+class BloomDupeFilter(RFPDupeFilter):
+    """
+    Duplicate request filter backed by a Bloom filter instead of a set of fingerprints.
+
+    Memory use is fixed by the configured capacity and false positive rate
+    (~1.8 bytes per request at 0.1%) rather than growing with every fingerprint.
+    A false positive means a new request is treated as already seen, so the
+    error rate should stay small relative to the number of example pages.
+
+    When JOBDIR is set, the bit array is stored in ``requests.bloom`` so a
+    resumed crawl keeps its filter state.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        debug: bool = False,
+        *,
+        capacity: int = 200_000,
+        error_rate: float = 0.001,
+        **kwargs: Any,
+    ) -> None:
+        # Fingerprints are kept in the bit array, not in the parent's requests.seen file
+        super().__init__(None, debug, **kwargs)
+
+        # Optimal bit count and hash count for the requested capacity and error rate
+        self.num_bits: int = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes: int = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits: bytearray = bytearray((self.num_bits + 7) // 8)
+
+        self.bloom_file: Path | None = Path(path, "requests.bloom") if path else None
+        if self.bloom_file and self.bloom_file.exists():
+            data = self.bloom_file.read_bytes()
+            if len(data) == len(self.bits):
+                self.bits[:] = data
+
+    @classmethod
+    def from_crawler(cls, crawler: Crawler) -> "BloomDupeFilter":
+        settings = crawler.settings
+        return cls(
+            job_dir(settings),
+            settings.getbool("DUPEFILTER_DEBUG"),
+            capacity=settings.getint("BLOOM_DUPEFILTER_CAPACITY", 200_000),
+            error_rate=settings.getfloat("BLOOM_DUPEFILTER_ERROR_RATE", 0.001),
+            fingerprinter=crawler.request_fingerprinter,
+        )
+
+    def request_seen(self, request: Request) -> bool:
+        """Check the request's fingerprint bits, setting them if any are missing"""
+        fp = self.fingerprinter.fingerprint(request)
+
+        # Double hashing: derive all bit positions from two halves of the fingerprint
+        h1 = int.from_bytes(fp[:8], "big")
+        h2 = int.from_bytes(fp[8:16], "big") | 1
+
+        seen = True
+        for i in range(self.num_hashes):
+            bit = (h1 + i * h2) % self.num_bits
+            mask = 1 << (bit & 7)
+            if not self.bits[bit >> 3] & mask:
+                self.bits[bit >> 3] |= mask
+                seen = False
+
+        return seen
+
+    def close(self, reason: str) -> None:
+        """Persist the bit array when running with a job directory"""
+        if self.bloom_file:
+            self.bloom_file.write_bytes(self.bits)
@@ -15,6 +15,9 @@ from itemadapter import ItemAdapter
 from scrapy import Spider
 from scrapy.exceptions import DropItem
 
+# Number of metadata entries buffered before they are appended to disk
+WRITE_BATCH_SIZE = 128
+
 
 class HtmlSavePipeline:
     """Pipeline to save HTML content to organized file structure"""
@@ -42,11 +45,10 @@ class HtmlSavePipeline:
         # Generate file path from URL
         file_path = self.url_to_file_path(url)
 
-        # Ensure parent directory exists
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Save HTML content
+        # Save HTML content before the item reaches MetadataLogPipeline, so
+        # file_path and save_error always reflect the outcome of the write
         try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
             with open(file_path, "w", encoding="utf-8") as f:
                 f.write(content)
 
@@ -110,6 +112,9 @@ class MetadataLogPipeline:
         self.errors_file: Path = self.metadata_dir / "errors.jsonl"
         self.manifest_file: Path = self.metadata_dir / "manifest.json"
 
+        # Pending metadata entries, flushed in batches
+        self.buffer: list[dict[str, Any]] = []
+
         # Initialize manifest
         self.init_manifest()
 
@@ -137,6 +142,11 @@ class MetadataLogPipeline:
             self.log_error(item)
             return item
 
+        # Pages whose HTML could not be written are errors, not crawled pages
+        if adapter.get("save_error"):
+            self.log_error({"url": adapter.get("url"), "error": adapter.get("save_error")})
+            return item
+
         # Prepare metadata entry
         metadata = {
             "url": adapter.get("url"),
@@ -147,16 +157,30 @@ class MetadataLogPipeline:
             "title": adapter.get("title"),
         }
 
-        # Log to URLs file
+        self.buffer.append(metadata)
+        if len(self.buffer) >= WRITE_BATCH_SIZE:
+            self.flush(spider)
+
+        return item
+
+    def flush(self, spider: Spider) -> None:
+        """Append all buffered metadata entries to the URLs file in one write"""
+        if not self.buffer:
+            return
+
+        pending, self.buffer = self.buffer, []
+
         try:
             with jsonlines.open(self.urls_file, mode="a") as writer:
-                writer.write(metadata)
-            spider.logger.debug(f"Logged metadata for {metadata['url']}")
+                writer.write_all(pending)
+            spider.logger.debug(f"Logged metadata for {len(pending)} pages")
 
         except Exception as e:
             spider.logger.error(f"Failed to log metadata: {e}")
 
-        return item
+    def close_spider(self, spider: Spider) -> None:
+        """Write any remaining buffered metadata entries"""
+        self.flush(spider)
 
     def log_error(self, error_item: dict[str, Any]) -> None:
         """Log error information"""
@@ -128,9 +128,11 @@ DEFAULT_REQUEST_HEADERS = {
     "Accept-Language": "en",
 }
 
-# Duplicate filtering
-DUPEFILTER_CLASS = "scrapy.dupefilters.RFPDupeFilter"
+# Duplicate filtering (Bloom filter sized for the expected number of requests)
+DUPEFILTER_CLASS = "solidworks_scraper.dupefilters.BloomDupeFilter"
 DUPEFILTER_DEBUG = True
+BLOOM_DUPEFILTER_CAPACITY = 200_000
+BLOOM_DUPEFILTER_ERROR_RATE = 0.001
 
 # URL boundaries configuration
 ALLOWED_DOMAINS = ["help.solidworks.com"]
@@ -10,8 +10,9 @@ This spider crawls example pages from the SolidWorks API documentation by:
 
 import hashlib
 import json
+import re
 import xml.etree.ElementTree as ET
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -21,6 +22,10 @@ import scrapy
 from scrapy.http import Response
 from twisted.python.failure import Failure
 
+# Matches the JSON-encoded helpContentData.helpText string so it can be decoded
+# on its own without parsing the rest of the (much larger) __NEXT_DATA__ payload
+_HELP_TEXT_RE = re.compile(r'"helpContentData"\s*:\s*\{\s*"helpText"\s*:\s*("[^"\\]*(?:\\.[^"\\]*)*")')
+
 
 class ExamplesSpider(scrapy.Spider):
     name = "examples"
@@ -31,7 +36,14 @@ class ExamplesSpider(scrapy.Spider):
         "DEPTH_LIMIT": 0,  # No depth limit, we're just crawling a list
     }
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
+    # hashlib algorithm for content_hash; validate_crawl.py must use the same one
+    HASH_ALGO = "sha256"
+
+    # XPath expressions used on every page
+    NEXT_DATA_XPATH = '//script[@id="__NEXT_DATA__"]/text()'
+    TITLE_XPATH = "//title/text()"
+
+    def __init__(self, *args: Any, example_urls: Iterable[str] | None = None, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.crawled_urls: set[str] = set()
         self.base_url: str = "https://help.solidworks.com/2026/english/api"
@@ -46,7 +58,15 @@ class ExamplesSpider(scrapy.Spider):
 
         # XML source file from Phase 3
         self.xml_file = Path(__file__).parent.parent.parent.parent / "40_extract_type_details" / "metadata" / "api_types.xml"
-        self.example_urls = self._load_urls()
+        if example_urls is not None:
+            # URLs already extracted by run_crawler.py, so the XML is not parsed again
+            self.example_urls = sorted({self._absolute_url(url) for url in example_urls})
+        else:
+            self.example_urls = self._load_urls()
+
+    def _absolute_url(self, url: str) -> str:
+        """Convert a relative example URL to an absolute one"""
+        return self.base_url + url if url.startswith("/") else url
 
     def _load_urls(self) -> list[str]:
         """Load example URLs directly from the XML file"""
@@ -64,13 +84,7 @@ class ExamplesSpider(scrapy.Spider):
             for example in root.findall(".//Example/Url"):
                 url = example.text
                 if url:
-                    url = url.strip()
-                    # Convert relative URL to absolute
-                    if url.startswith("/"):
-                        full_url = self.base_url + url
-                    else:
-                        full_url = url
-                    urls.add(full_url)
+                    urls.add(self._absolute_url(url.strip()))
 
             self.logger.info(f"Loaded {len(urls)} unique example URLs from {self.xml_file}")
             return sorted(urls)
@@ -108,18 +122,23 @@ class ExamplesSpider(scrapy.Spider):
         self.stats["total_pages"] += 1
 
         # Extract __NEXT_DATA__ JSON from the page
-        json_text = response.xpath('//script[@id="__NEXT_DATA__"]/text()').get()
+        json_text = response.xpath(self.NEXT_DATA_XPATH).get()
 
         if not json_text:
             self.logger.warning(f"No __NEXT_DATA__ JSON found in {response.url}")
             self.stats["skipped_pages"] += 1
             return
 
-        # Parse JSON and extract only helpText from helpContentData
+        # Decode only the helpText string, falling back to parsing the full JSON when
+        # the payload has other helpText keys or helpText is not first in helpContentData
         try:
-            data = json.loads(json_text)
-            help_content_data = data.get("props", {}).get("pageProps", {}).get("helpContentData", {})
-            help_text = help_content_data.get("helpText")
+            match = _HELP_TEXT_RE.search(json_text) if json_text.count('"helpText"') == 1 else None
+            if match:
+                help_text = json.loads(match.group(1))
+            else:
+                data = json.loads(json_text)
+                help_content_data = data.get("props", {}).get("pageProps", {}).get("helpContentData", {})
+                help_text = help_content_data.get("helpText")
 
             if not help_text:
                 self.logger.warning(f"No helpText found in {response.url}")
@@ -144,11 +163,12 @@ class ExamplesSpider(scrapy.Spider):
         }
 
         # Calculate content hash for integrity
-        item["content_hash"] = hashlib.sha256(content.encode("utf-8")).hexdigest()
-        item["content_length"] = len(content.encode("utf-8"))
+        content_bytes = content.encode("utf-8")
+        item["content_hash"] = hashlib.new(self.HASH_ALGO, content_bytes).hexdigest()
+        item["content_length"] = len(content_bytes)
 
         # Extract title for better organization
-        title = response.xpath("//title/text()").get()
+        title = response.xpath(self.TITLE_XPATH).get()
         item["title"] = title.strip() if title else "Untitled"
 
         self.stats["successful_pages"] += 1
@@ -100,3 +100,26 @@ def test_pipeline_skips_error_items(spider):
 
     result = pipeline.process_item(error_item, spider)
     assert result == error_item  # Should pass through unchanged
+
+
+def test_html_save_pipeline_records_write_result(spider, temp_output_dir):
+    """Test that file_path is set only after a successful write and failures set save_error"""
+    pipeline = HtmlSavePipeline()
+    pipeline.output_dir = temp_output_dir / "output" / "html"
+
+    item = {
+        "url": "https://help.solidworks.com/2026/english/api/sldworksapi/test.htm",
+        "content": "<html><body>Example</body></html>",
+    }
+
+    result = pipeline.process_item(item, spider)
+    file_path = temp_output_dir / result["file_path"]
+    assert file_path.read_text(encoding="utf-8") == "<html><body>Example</body></html>"
+
+    # A file where the output directory should be makes the write fail
+    pipeline.output_dir = temp_output_dir / "blocked"
+    pipeline.output_dir.write_text("", encoding="utf-8")
+
+    failed = pipeline.process_item({"url": item["url"], "content": item["content"]}, spider)
+    assert "file_path" not in failed
+    assert failed["save_error"]
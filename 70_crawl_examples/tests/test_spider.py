@@ -6,6 +6,7 @@ from pathlib import Path
 import pytest
 from scrapy.http import HtmlResponse, Request
 
+from solidworks_scraper.dupefilters import BloomDupeFilter
 from solidworks_scraper.spiders.examples_spider import ExamplesSpider
 
 
@@ -71,6 +72,22 @@ def test_load_urls_converts_relative_to_absolute():
         temp_path.unlink()
 
 
+def test_spider_accepts_preloaded_urls():
+    """Test that URLs handed over by run_crawler skip the XML and are normalised"""
+    spider = ExamplesSpider(
+        example_urls={
+            "/sldworksapi/a.htm",
+            "https://help.solidworks.com/2026/english/api/sldworksapi/a.htm",
+            "https://x/b.htm",
+        }
+    )
+
+    assert spider.example_urls == [
+        "https://help.solidworks.com/2026/english/api/sldworksapi/a.htm",
+        "https://x/b.htm",
+    ]
+
+
 def test_load_urls_removes_duplicates():
     """Test that duplicate URLs are removed"""
     xml_content = """<?xml version="1.0" ?>
@@ -178,3 +195,88 @@ def test_parse_page_handles_missing_next_data(spider):
     items = list(spider.parse_page(response))
     assert len(items) == 0
     assert spider.stats["skipped_pages"] == 1
+
+
+def test_parse_page_decodes_escaped_help_text(spider):
+    """Test that escaped characters in helpText are decoded"""
+    html_content = r"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Test Page</title>
+    </head>
+    <body>
+        <script id="__NEXT_DATA__" type="application/json">
+        {"props": {"pageProps": {"helpContentData": {"helpText": "<a href=\"x.htm\">Link</a>\né\\"}}}}
+        </script>
+    </body>
+    </html>
+    """
+
+    url = "https://help.solidworks.com/2026/english/api/sldworksapi/test.htm"
+    request = Request(url)
+    response = HtmlResponse(
+        url=url,
+        request=request,
+        body=html_content.encode("utf-8"),
+        encoding="utf-8",
+        headers={"Content-Type": b"text/html; charset=utf-8"},
+    )
+
+    items = list(spider.parse_page(response))
+    assert len(items) == 1
+    assert items[0]["content"] == '<a href="x.htm">Link</a>\né\\'
+
+
+def test_parse_page_reads_help_text_from_help_content_data(spider):
+    """Test that other helpText keys in the payload are not mistaken for the page content"""
+    html_content = """
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Test Page</title>
+    </head>
+    <body>
+        <script id="__NEXT_DATA__" type="application/json">
+        {"props": {"pageProps": {"nav": {"helpText": "wrong"},
+         "helpContentData": {"title": "Test", "helpText": "<p>right</p>"}}}}
+        </script>
+    </body>
+    </html>
+    """
+
+    url = "https://help.solidworks.com/2026/english/api/sldworksapi/test.htm"
+    request = Request(url)
+    response = HtmlResponse(
+        url=url,
+        request=request,
+        body=html_content.encode("utf-8"),
+        encoding="utf-8",
+        headers={"Content-Type": b"text/html; charset=utf-8"},
+    )
+
+    items = list(spider.parse_page(response))
+    assert len(items) == 1
+    assert items[0]["content"] == "<p>right</p>"
+
+
+def test_bloom_dupefilter_detects_duplicates():
+    """Test that the Bloom dupefilter reports repeated requests as seen"""
+    dupefilter = BloomDupeFilter(capacity=1000, error_rate=0.001)
+
+    urls = [f"https://help.solidworks.com/2026/english/api/sldworksapi/test{i}.htm" for i in range(100)]
+
+    assert not any(dupefilter.request_seen(Request(url)) for url in urls)
+    assert all(dupefilter.request_seen(Request(url)) for url in urls)
+
+
+def test_bloom_dupefilter_persists_to_job_dir(tmp_path):
+    """Test that the Bloom dupefilter state survives a restart with JOBDIR"""
+    url = "https://help.solidworks.com/2026/english/api/sldworksapi/test.htm"
+
+    dupefilter = BloomDupeFilter(str(tmp_path))
+    assert not dupefilter.request_seen(Request(url))
+    dupefilter.close("finished")
+
+    resumed = BloomDupeFilter(str(tmp_path))
+    assert resumed.request_seen(Request(url))
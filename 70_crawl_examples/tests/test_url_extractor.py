@@ -1,15 +1,19 @@
 """Tests for the URL extractor script"""
 
-import tempfile
-import xml.etree.ElementTree as ET
-from pathlib import Path
+import os
 
 import pytest
 
-from extract_example_urls import extract_urls_from_xml
+from extract_example_urls import extract_urls_from_xml, load_example_urls
 
 
-def test_extract_urls_from_simple_xml():
+@pytest.fixture
+def xml_file(tmp_path):
+    """Path for a temporary api_types.xml, removed by pytest after the test"""
+    return tmp_path / "api_types.xml"
+
+
+def test_extract_urls_from_simple_xml(xml_file):
     """Test URL extraction from simple XML structure"""
     xml_content = """<?xml version="1.0" ?>
 <Types>
@@ -27,26 +31,18 @@ def test_extract_urls_from_simple_xml():
 </Types>
 """
 
-    # Create temporary XML file
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".xml") as f:
-        f.write(xml_content)
-        temp_path = Path(f.name)
+    xml_file.write_text(xml_content)
 
-    try:
-        # Extract URLs
-        urls = extract_urls_from_xml(temp_path)
+    # Extract URLs
+    urls = extract_urls_from_xml(xml_file)
 
-        # Check results
-        assert len(urls) == 2
-        assert "/sldworksapi/test1.htm" in urls
-        assert "/sldworksapi/test2.htm" in urls
+    # Check results
+    assert len(urls) == 2
+    assert "/sldworksapi/test1.htm" in urls
+    assert "/sldworksapi/test2.htm" in urls
 
-    finally:
-        # Clean up
-        temp_path.unlink()
 
-
-def test_extract_urls_removes_duplicates():
+def test_extract_urls_removes_duplicates(xml_file):
     """Test that duplicate URLs are removed"""
     xml_content = """<?xml version="1.0" ?>
 <Types>
@@ -72,23 +68,16 @@ def test_extract_urls_removes_duplicates():
 </Types>
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".xml") as f:
-        f.write(xml_content)
-        temp_path = Path(f.name)
-
-    try:
-        urls = extract_urls_from_xml(temp_path)
+    xml_file.write_text(xml_content)
+    urls = extract_urls_from_xml(xml_file)
 
-        # Should have 2 unique URLs
-        assert len(urls) == 2
-        assert "/sldworksapi/test1.htm" in urls
-        assert "/sldworksapi/test2.htm" in urls
+    # Should have 2 unique URLs
+    assert len(urls) == 2
+    assert "/sldworksapi/test1.htm" in urls
+    assert "/sldworksapi/test2.htm" in urls
 
-    finally:
-        temp_path.unlink()
 
-
-def test_extract_urls_handles_empty_examples():
+def test_extract_urls_handles_empty_examples(xml_file):
     """Test extraction with no examples"""
     xml_content = """<?xml version="1.0" ?>
 <Types>
@@ -98,19 +87,12 @@ def test_extract_urls_handles_empty_examples():
 </Types>
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".xml") as f:
-        f.write(xml_content)
-        temp_path = Path(f.name)
-
-    try:
-        urls = extract_urls_from_xml(temp_path)
-        assert len(urls) == 0
-
-    finally:
-        temp_path.unlink()
+    xml_file.write_text(xml_content)
+    urls = extract_urls_from_xml(xml_file)
+    assert len(urls) == 0
 
 
-def test_extract_urls_handles_whitespace():
+def test_extract_urls_handles_whitespace(xml_file):
     """Test that URLs with surrounding whitespace are trimmed"""
     xml_content = """<?xml version="1.0" ?>
 <Types>
@@ -125,14 +107,48 @@ def test_extract_urls_handles_whitespace():
 </Types>
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".xml") as f:
-        f.write(xml_content)
-        temp_path = Path(f.name)
+    xml_file.write_text(xml_content)
+    urls = extract_urls_from_xml(xml_file)
+    assert len(urls) == 1
+    assert "/sldworksapi/test1.htm" in urls
+
+
+def test_load_example_urls_writes_and_reuses_cache(xml_file, monkeypatch):
+    """Test that extracted URLs are cached and the cache is reused only while it matches the XML"""
+    xml_content = """<?xml version="1.0" ?>
+<Types>
+    <Type>
+        <Examples>
+            <Example>
+                <Url>/sldworksapi/test2.htm</Url>
+            </Example>
+            <Example>
+                <Url>/sldworksapi/test1.htm</Url>
+            </Example>
+        </Examples>
+    </Type>
+</Types>
+"""
+
+    xml_file.write_text(xml_content)
+    cache_file = xml_file.parent / "example_urls.txt"
+
+    urls = load_example_urls(xml_file, cache_file)
+    assert urls == {"/sldworksapi/test1.htm", "/sldworksapi/test2.htm"}
+    assert cache_file.read_text() == "/sldworksapi/test1.htm\n/sldworksapi/test2.htm\n"
+
+    # An unchanged cache is read instead of the XML
+    monkeypatch.setattr("extract_example_urls.extract_urls_from_xml", lambda _: pytest.fail("XML re-parsed"))
+    assert load_example_urls(xml_file, cache_file) == urls
+    monkeypatch.undo()
 
-    try:
-        urls = extract_urls_from_xml(temp_path)
-        assert len(urls) == 1
-        assert "/sldworksapi/test1.htm" in urls
+    # A hand-edited cache is rebuilt from the XML, even when it is newer
+    cache_file.write_text("/sldworksapi/edited.htm\n")
+    os.utime(cache_file, (xml_file.stat().st_mtime + 10,) * 2)
+    assert load_example_urls(xml_file, cache_file) == urls
 
-    finally:
-        temp_path.unlink()
+    # So is a cache of an XML file that changed since; the new content has a different
+    # size and an explicit mtime, so the stamp differs even with coarse timestamps
+    xml_file.write_text(xml_content.replace("test2", "test_changed"))
+    os.utime(xml_file, (xml_file.stat().st_mtime + 20,) * 2)
+    assert load_example_urls(xml_file, cache_file) == {"/sldworksapi/test1.htm", "/sldworksapi/test_changed.htm"}
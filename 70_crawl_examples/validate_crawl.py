@@ -16,12 +16,117 @@ Options:
 
 import argparse
 import hashlib
+import heapq
 import json
+import mmap
+import os
+import random
+import re
+import xml.sax
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import jsonlines
+try:
+    from lxml import etree
+except ImportError:  # lxml ships with Scrapy, but fall back to the stdlib parser without it
+    etree = None
+
+# Number of files whose content hash is re-checked
+INTEGRITY_SAMPLE_SIZE = 100
+
+# Fields every urls_crawled.jsonl entry must have
+REQUIRED_FIELDS = ("url", "content_hash", "file_path")
+
+# hashlib algorithm used for content_hash, matching ExamplesSpider.HASH_ALGO
+HASH_ALGO = "sha256"
+
+# Files at least this large are hashed through a read-only memory map
+MMAP_THRESHOLD = 1 << 20
+
+# Crawled URLs are matched against source XML URLs by the path after this prefix
+API_PATH_PREFIX = "/2026/english/api"
+_API_PATH_TAIL_RE = re.compile(re.escape(API_PATH_PREFIX) + r"(.*)", re.DOTALL)
+
+# Use orjson for JSON parsing and report writing when it is installed
+json_loads: Callable[[bytes], Any]
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    json_loads = json.loads
+
+
+def iter_jsonl(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield one object per non-blank line of a JSON Lines file"""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+
+        # Scan for newlines in the mapped file instead of iterating lines in Python
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            start = 0
+            while start < size:
+                end = mm.find(b"\n", start)
+                if end < 0:
+                    end = size
+                line = mm[start:end]
+                if line.strip():
+                    yield json_loads(line)
+                start = end + 1
+
+
+class ExampleUrlHandler(xml.sax.ContentHandler):
+    """SAX handler collecting the text of <Url> elements that are direct children of <Example>"""
+
+    def __init__(self, urls: set[str]) -> None:
+        super().__init__()
+        self.urls = urls
+        # Names of the currently open elements
+        self.open_tags: list[str] = []
+        # Depth of the <Url> being read, or 0 when not inside one
+        self.url_depth = 0
+        # Only text before the <Url>'s first child counts, like lxml's elem.text
+        self.url_text_done = False
+        self.text_parts: list[str] = []
+
+    def startElement(self, name: str, attrs: Any) -> None:  # noqa: N802
+        if self.url_depth:
+            self.url_text_done = True
+        elif name == "Url" and self.open_tags and self.open_tags[-1] == "Example":
+            self.url_depth = len(self.open_tags) + 1
+            self.url_text_done = False
+            self.text_parts = []
+        self.open_tags.append(name)
+
+    def characters(self, content: str) -> None:
+        if self.url_depth and not self.url_text_done:
+            self.text_parts.append(content)
+
+    def endElement(self, name: str) -> None:  # noqa: N802
+        if self.url_depth == len(self.open_tags):
+            self.url_depth = 0
+            url = "".join(self.text_parts).strip()
+            if url:
+                self.urls.add(url)
+        self.open_tags.pop()
+
+
+def scan_html_files(root: Path) -> Iterator[os.DirEntry[str]]:
+    """Yield directory entries for all .html files under root, using cached scandir stat data"""
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".html"):
+                    yield entry
 
 
 class CrawlValidator:
@@ -39,6 +144,22 @@ class CrawlValidator:
         self.source_xml_file = Path("40_extract_type_details/metadata/api_types.xml")
         self.html_dir = output_dir / "html"
 
+        # Fallback base for relative file paths in the metadata
+        self.repo_root = Path(__file__).parent.parent
+
+        # Metadata from urls_crawled.jsonl, loaded once and shared by all checks
+        self.metadata_loaded = False
+        self.entry_count = 0
+        self.integrity_sample: list[dict[str, Any]] = []
+        self.unique_urls: set[str | None] = set()
+        self.duplicate_count = 0
+        self.incomplete_entries: list[tuple[str, list[str]]] = []
+        self.crawled_paths: set[str] = set()
+
+        # Absolute paths of the HTML files found by check_html_files, so the
+        # integrity check can skip a stat call for files already seen
+        self.html_index: set[str] = set()
+
         # Validation results
         self.results: dict[str, Any] = {
             "validation_passed": True,
@@ -53,6 +174,9 @@ class CrawlValidator:
         print("VALIDATING PHASE 05 CRAWL RESULTS")
         print("=" * 60)
 
+        # Read the crawl metadata once for the checks below
+        self.load_metadata()
+
         # Run all checks
         self.check_files_exist()
         self.check_url_coverage()
@@ -66,6 +190,44 @@ class CrawlValidator:
 
         return self.results["validation_passed"]
 
+    def load_metadata(self) -> None:
+        """Read urls_crawled.jsonl in a single pass, collecting everything the checks need"""
+        if self.metadata_loaded:
+            return
+        self.metadata_loaded = True
+
+        if not self.urls_file.exists():
+            return
+
+        for index, entry in enumerate(iter_jsonl(self.urls_file)):
+            self.entry_count += 1
+            url = entry.get("url")
+
+            # Reservoir sampling (Algorithm R) keeps a uniform random sample
+            # for the integrity check without holding every entry in memory
+            if index < INTEGRITY_SAMPLE_SIZE:
+                self.integrity_sample.append(entry)
+            else:
+                slot = random.randint(0, index)
+                if slot < INTEGRITY_SAMPLE_SIZE:
+                    self.integrity_sample[slot] = entry
+
+            # Duplicate detection
+            if url in self.unique_urls:
+                self.duplicate_count += 1
+            else:
+                self.unique_urls.add(url)
+
+            # Missing required fields
+            missing = [field for field in REQUIRED_FIELDS if not entry.get(field)]
+            if missing:
+                self.incomplete_entries.append((entry.get("url", "unknown"), missing))
+
+        # Path portion of each distinct URL, to match against source URLs
+        self.crawled_paths = {
+            match.group(1) for url in self.unique_urls if url and (match := _API_PATH_TAIL_RE.search(url))
+        }
+
     def check_files_exist(self) -> None:
         """Check that all required files exist"""
         print("\n1. Checking required files...")
@@ -104,36 +266,41 @@ class CrawlValidator:
             return
 
         # Load source URLs from XML
-        import xml.etree.ElementTree as ET
-        source_urls = set()
+        source_urls: set[str] = set()
 
         try:
-            tree = ET.parse(self.source_xml_file)
-            root = tree.getroot()
-
-            for example in root.findall(".//Example/Url"):
-                url = example.text
-                if url and url.strip():
-                    source_urls.add(url.strip())
+            if etree is not None:
+                # Read each <Example>'s <Url> children as it ends, and free each finished
+                # <Type> (and the siblings before it) so about one type is held at a time
+                context = etree.iterparse(str(self.source_xml_file), events=("end",), tag=("Example", "Type"))
+                for _, elem in context:
+                    if elem.tag == "Example":
+                        for url_elem in elem.iterchildren("Url"):
+                            url = url_elem.text
+                            if url and url.strip():
+                                source_urls.add(url.strip())
+                    else:
+                        elem.clear()
+                        while elem.getprevious() is not None:
+                            del elem.getparent()[0]
+            else:
+                # Without lxml, stream with SAX so no element tree is built at all
+                xml.sax.parse(str(self.source_xml_file), ExampleUrlHandler(source_urls))
 
         except Exception as e:
             print(f"  [ERROR] Failed to parse XML: {e}")
             return
 
-        # Load crawled URLs
-        crawled_urls = set()
-        if self.urls_file.exists():
-            with jsonlines.open(self.urls_file) as reader:
-                for obj in reader:
-                    url = obj.get("url", "")
-                    # Extract the path portion to match against source URLs
-                    if "/2026/english/api" in url:
-                        path = url.split("/2026/english/api")[1]
-                        crawled_urls.add(path)
+        self.load_metadata()
+        crawled_urls = self.crawled_paths
 
         # Calculate coverage
         coverage = len(crawled_urls) / len(source_urls) * 100 if source_urls else 0
-        missing = source_urls - crawled_urls
+        if len(source_urls) == len(crawled_urls) and crawled_urls.issuperset(source_urls):
+            # Complete crawl: equal sizes plus containment means the sets are equal
+            missing_count = 0
+        else:
+            missing_count = len(source_urls) - len(source_urls & crawled_urls)
 
         print(f"  Source URLs: {len(source_urls)}")
         print(f"  Crawled URLs: {len(crawled_urls)}")
@@ -143,16 +310,18 @@ class CrawlValidator:
             "source_count": len(source_urls),
             "crawled_count": len(crawled_urls),
             "coverage_percent": coverage,
-            "missing_count": len(missing),
+            "missing_count": missing_count,
         }
 
         if coverage < 95:
             self.results["warnings"].append(f"URL coverage below 95%: {coverage:.2f}%")
             print(f"  [WARN] Coverage below 95%")
 
-            if self.verbose and len(missing) <= 20:
+            if self.verbose and missing_count <= 20:
+                # Only build the difference when it is actually listed
+                missing = source_urls - crawled_urls
                 print(f"\n  Missing URLs:")
-                for url in sorted(missing)[:20]:
+                for url in heapq.nsmallest(20, missing):
                     print(f"    - {url}")
         else:
             print("  [PASS] URL coverage >= 95%")
@@ -166,22 +335,30 @@ class CrawlValidator:
             self.results["validation_passed"] = False
             return
 
-        html_files = list(self.html_dir.rglob("*.html"))
-        total_size = sum(f.stat().st_size for f in html_files)
-
-        print(f"  HTML files: {len(html_files)}")
+        # Count files, total size and empty files in one walk
+        file_count = 0
+        total_size = 0
+        empty_count = 0
+        for entry in scan_html_files(Path(os.path.abspath(self.html_dir))):
+            self.html_index.add(entry.path)
+            size = entry.stat().st_size
+            file_count += 1
+            total_size += size
+            if size == 0:
+                empty_count += 1
+
+        print(f"  HTML files: {file_count}")
         print(f"  Total size: {total_size / (1024 * 1024):.2f} MB")
 
         self.results["checks"]["html_files"] = {
-            "count": len(html_files),
+            "count": file_count,
             "total_size_bytes": total_size,
         }
 
         # Check for empty files
-        empty_files = [f for f in html_files if f.stat().st_size == 0]
-        if empty_files:
-            self.results["warnings"].append(f"Found {len(empty_files)} empty HTML files")
-            print(f"  [WARN] {len(empty_files)} empty files")
+        if empty_count:
+            self.results["warnings"].append(f"Found {empty_count} empty HTML files")
+            print(f"  [WARN] {empty_count} empty files")
         else:
             print("  [PASS] No empty HTML files")
 
@@ -193,17 +370,11 @@ class CrawlValidator:
             print("  [SKIP] URLs file not found")
             return
 
-        # Load metadata
-        metadata_entries = []
-        with jsonlines.open(self.urls_file) as reader:
-            metadata_entries = list(reader)
+        self.load_metadata()
+        duplicates = self.duplicate_count
 
-        # Check for duplicates
-        urls = [entry.get("url") for entry in metadata_entries]
-        duplicates = len(urls) - len(set(urls))
-
-        print(f"  Metadata entries: {len(metadata_entries)}")
-        print(f"  Unique URLs: {len(set(urls))}")
+        print(f"  Metadata entries: {self.entry_count}")
+        print(f"  Unique URLs: {len(self.unique_urls)}")
 
         if duplicates > 0:
             self.results["errors"].append(f"Found {duplicates} duplicate URLs in metadata")
@@ -213,13 +384,7 @@ class CrawlValidator:
             print("  [PASS] No duplicate URLs")
 
         # Check for missing required fields
-        required_fields = ["url", "content_hash", "file_path"]
-        incomplete_entries = []
-
-        for entry in metadata_entries:
-            missing = [field for field in required_fields if not entry.get(field)]
-            if missing:
-                incomplete_entries.append((entry.get("url", "unknown"), missing))
+        incomplete_entries = self.incomplete_entries
 
         if incomplete_entries:
             self.results["warnings"].append(f"{len(incomplete_entries)} entries missing fields")
@@ -239,8 +404,8 @@ class CrawlValidator:
             print("  [SKIP] Statistics file not found")
             return
 
-        with open(self.stats_file) as f:
-            stats = json.load(f)
+        with open(self.stats_file, "rb") as f:
+            stats = json_loads(f.read())
 
         total = stats.get("total_pages", 0)
         successful = stats.get("successful_pages", 0)
@@ -280,36 +445,22 @@ class CrawlValidator:
             print("  [SKIP] URLs file not found")
             return
 
-        # Sample check (not all files for performance)
-        with jsonlines.open(self.urls_file) as reader:
-            entries = list(reader)
+        # Sample check (not all files for performance): up to 100 random files
+        self.load_metadata()
+        sample = self.integrity_sample
+        sample_size = len(sample)
 
-        # Check up to 100 random files
-        import random
-
-        sample_size = min(100, len(entries))
-        sample = random.sample(entries, sample_size) if len(entries) > sample_size else entries
+        # Hash files on a thread pool; hashlib releases the GIL, so reads and hashing overlap
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self._hash_mismatch, sample))
 
         mismatches = 0
-        for entry in sample:
-            file_path = entry.get("file_path")
-            stored_hash = entry.get("content_hash")
-
-            if not file_path or not stored_hash:
-                continue
-
-            full_path = Path(file_path)
-            if not full_path.exists():
-                full_path = Path(__file__).parent.parent / file_path
-
-            if full_path.exists():
-                with open(full_path, "rb") as f:
-                    actual_hash = hashlib.sha256(f.read()).hexdigest()
-
-                if actual_hash != stored_hash:
-                    mismatches += 1
-                    if self.verbose:
-                        print(f"  Hash mismatch: {file_path}")
+        for entry, mismatch in zip(sample, results, strict=True):
+            if mismatch:
+                mismatches += 1
+                if self.verbose:
+                    print(f"  Hash mismatch: {entry.get('file_path')}")
 
         print(f"  Sampled files: {sample_size}")
         print(f"  Hash mismatches: {mismatches}")
@@ -325,6 +476,38 @@ class CrawlValidator:
         else:
             print("  [PASS] All sampled files have correct hashes")
 
+    def _hash_mismatch(self, entry: dict[str, Any]) -> bool:
+        """Check whether an entry's file exists and its hash differs from the stored content_hash"""
+        file_path = entry.get("file_path")
+        stored_hash = entry.get("content_hash")
+
+        if not file_path or not stored_hash:
+            return False
+
+        # Relative paths are tried from the working directory, then from the repo root
+        full_path = Path(file_path)
+        if not self._html_file_exists(full_path):
+            if full_path.is_absolute():
+                return False
+            full_path = self.repo_root / full_path
+            if not self._html_file_exists(full_path):
+                return False
+
+        with open(full_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+                # Hash straight from the page cache without copying the file onto the heap
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    actual_hash = hashlib.new(HASH_ALGO, mm).hexdigest()
+            else:
+                # file_digest hashes in fixed-size chunks instead of reading the whole file into memory
+                actual_hash = hashlib.file_digest(f, HASH_ALGO).hexdigest()
+
+        return bool(actual_hash != stored_hash)
+
+    def _html_file_exists(self, path: Path) -> bool:
+        """Check the HTML index first and only stat paths it does not contain"""
+        return os.path.abspath(path) in self.html_index or path.exists()
+
     def print_summary(self) -> None:
         """Print validation summary"""
         print("\n" + "=" * 60)
@@ -350,8 +533,13 @@ class CrawlValidator:
 
     def save_report(self, report_file: Path) -> None:
         """Save detailed validation report"""
-        with open(report_file, "w", encoding="utf-8") as f:
-            json.dump(self.results, f, indent=2)
+        if orjson is not None:
+            # Serialize in one call and write the bytes through a single buffered write
+            with open(report_file, "wb", buffering=1 << 16) as f:
+                f.write(orjson.dumps(self.results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(report_file, "w", encoding="utf-8") as f:
+                json.dump(self.results, f, indent=2)
 
         print(f"\nDetailed report saved to: {report_file}")
 
@@ -11,29 +11,79 @@ This script:
 
 import os
 import sys
+import re
 import json
 import hashlib
+import multiprocessing
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
 from bs4 import BeautifulSoup
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
+from xml.sax.saxutils import escape
+
+# Extensions of file-name headings, which get a blank line before them
+_FILE_EXTS = ('.vb', '.cs', '.cpp', '.h', '.js', '.py', '.java')
+
+# Extra entity escaped in Url text, matching the previous minidom output
+_QUOTE_ENTITY = {'"': '&quot;'}
+
+# Opening tags of the top-level elements parse_html_file extracts content from
+_CONTENT_TAG_RE = re.compile(r'<(?:h[123]|p|div)', re.IGNORECASE)
+
+# Cleanup patterns for the joined content in ExampleParser.parse_html_file
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+_TRAILING_WS_RE = re.compile(r'[^\S\n]+$', re.MULTILINE)
+
+# Whitespace patterns used by ExampleParser._get_inner_html
+_HORIZONTAL_WS_RE = re.compile(r'[ \t]+')
+_NEWLINE_INDENT_RE = re.compile(r'\n[ \t]*')
+_SOURCE_BREAK_RE = re.compile(r'[\r\n\t]+')
+_SPACES_RE = re.compile(r' +')
+_LEADING_WS_RE = re.compile(r'^([ \t]*)(.*)')
+_DOUBLE_SPACE_RE = re.compile(r' {2,}')
+_TRAILING_SPACES_RE = re.compile(r' +\n')
+
+
+def iter_example_files(root: Union[str, Path]) -> Iterator[os.DirEntry[str]]:
+    """
+    Yield directory entries for .htm files under root.
+
+    os.scandir already knows each entry's type, so directories are walked
+    without the per-path stat calls and Path objects that rglob creates.
+    """
+    with os.scandir(root) as it:
+        entries = list(it)
+
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            subdirs.append(entry.path)
+        elif entry.name.endswith('.htm'):
+            yield entry
+
+    for subdir in subdirs:
+        yield from iter_example_files(subdir)
 
 
 class ExampleParser:
     """Parses HTML example files and extracts structured content."""
 
-    def __init__(self, html_dir: Path, output_file: Path):
+    def __init__(self, html_dir: Path, output_file: Path, workers: int = 1):
         """
         Initialize the parser.
 
         Args:
             html_dir: Directory containing HTML files from Phase 05
             output_file: Output XML file path
+            workers: Number of worker processes used to parse HTML files
         """
         self.html_dir = Path(html_dir)
         self.output_file = Path(output_file)
+        self.workers = workers
+        # html_dir with a trailing separator, stripped from file paths under it
+        self._html_dir_prefix = os.path.join(str(self.html_dir), '')
         self.stats = {
             'total_files': 0,
             'successful': 0,
@@ -56,6 +106,12 @@ class ExampleParser:
             with open(file_path, 'r', encoding='utf-8') as f:
                 html_content = f.read()
 
+            # Skip the parse when there is no tag the walk below could pick up
+            if not _CONTENT_TAG_RE.search(html_content):
+                return None
+
+            # html.parser keeps the fragment's tree as written; lxml closes <p> before
+            # nested block elements and would drop text inside them
             soup = BeautifulSoup(html_content, 'html.parser')
 
             # Extract all content elements
@@ -83,7 +139,7 @@ class ExampleParser:
                         content_parts.append(text)
 
                 elif element.name == 'div' and (
-                    'Monospace' in str(element.get('style', '')) or
+                    'Monospace' in (element.get('style') or '') or
                     element.find('p', class_='APICODE')
                 ):
                     # This is a code container div
@@ -127,7 +183,7 @@ class ExampleParser:
                     text = element.get_text().strip()
                     if text:
                         # Check if this looks like a file name (ends with file extension)
-                        if any(text.endswith(ext) for ext in ['.vb', '.cs', '.cpp', '.h', '.js', '.py', '.java']):
+                        if text.endswith(_FILE_EXTS):
                             content_parts.append(f'\n{text}')
                         else:
                             content_parts.append(text)
@@ -140,15 +196,12 @@ class ExampleParser:
             formatted_content = '\n'.join(content_parts)
 
             # Clean up excessive blank lines (more than 2 consecutive)
-            while '\n\n\n' in formatted_content:
-                formatted_content = formatted_content.replace('\n\n\n', '\n\n')
+            formatted_content = _BLANK_LINES_RE.sub('\n\n', formatted_content)
 
-            # Remove trailing spaces on each line
-            lines = formatted_content.split('\n')
-            lines = [line.rstrip() for line in lines]
-            formatted_content = '\n'.join(lines)
+            # Remove trailing whitespace on each line
+            formatted_content = _TRAILING_WS_RE.sub('', formatted_content).strip()
 
-            return formatted_content.strip() if formatted_content.strip() else None
+            return formatted_content if formatted_content else None
 
         except Exception as e:
             self.errors.append({
@@ -169,8 +222,6 @@ class ExampleParser:
         Returns:
             Text content as string
         """
-        import re
-
         # Use a placeholder for br tags to preserve intentional line breaks
         LINEBREAK_MARKER = '<<<LINEBREAK>>>'
 
@@ -179,22 +230,24 @@ class ExampleParser:
             br.replace_with(LINEBREAK_MARKER)
 
         # Get text content (automatically strips all HTML tags and decodes entities)
-        text = element.get_text()
+        text: str = element.get_text()
 
         if is_pre:
             # For <pre> blocks: preserve actual newlines from HTML source
-            # Just normalize horizontal whitespace on each line
+            # Just normalize horizontal whitespace on each line; this also drops
+            # trailing and doubled spaces, so no further cleanup is needed
             lines = text.split('\n')
             processed_lines = []
             for line in lines:
                 # Collapse multiple spaces/tabs but preserve leading whitespace
-                match = re.match(r'^([ \t]*)(.*)', line)
+                match = _LEADING_WS_RE.match(line)
                 if match:
                     leading = match.group(1)
                     rest = match.group(2)
                     # Collapse multiple spaces in the rest
-                    rest = re.sub(r'[ \t]+', ' ', rest)
-                    processed_lines.append(leading + rest.rstrip())
+                    rest = _HORIZONTAL_WS_RE.sub(' ', rest).rstrip()
+                    # Whitespace-only lines keep their tabs but not trailing spaces
+                    processed_lines.append(leading + rest if rest else leading.rstrip(' '))
                 else:
                     processed_lines.append(line.rstrip())
             text = '\n'.join(processed_lines)
@@ -208,8 +261,8 @@ class ExampleParser:
             for segment in segments:
                 # First, collapse ALL whitespace (including HTML source newlines) to spaces
                 # This handles HTML formatting while preserving the space characters from &nbsp;
-                collapsed = re.sub(r'[\r\n\t]+', ' ', segment)  # Convert newlines/tabs to spaces
-                collapsed = re.sub(r' +', ' ', collapsed)  # Collapse multiple spaces to one
+                collapsed = _SOURCE_BREAK_RE.sub(' ', segment)  # Convert newlines/tabs to spaces
+                collapsed = _SPACES_RE.sub(' ', collapsed)  # Collapse multiple spaces to one
 
                 # Now strip ONLY leading/trailing spaces that came from HTML formatting
                 # But we need to preserve leading spaces from &nbsp; (indentation)
@@ -218,71 +271,47 @@ class ExampleParser:
 
                 # Now restore proper indentation by counting leading spaces in original segment
                 # Extract leading spaces from the ORIGINAL segment (before collapsing)
-                # Include both regular spaces and non-breaking spaces (\xa0 from &nbsp;)
-                original_leading = ''
-                for char in segment:
-                    if char in ' \t\xa0':
-                        original_leading += char
-                    elif char in '\r\n':
-                        # Skip HTML source newlines
-                        continue
-                    else:
-                        # Hit first non-whitespace, stop
-                        break
+                # Include both regular spaces and non-breaking spaces (\xa0 from &nbsp;),
+                # skipping HTML source newlines
+                indent_length = len(segment) - len(segment.lstrip(' \t\xa0\r\n'))
+                original_leading = segment[:indent_length].replace('\r', '').replace('\n', '')
 
                 # Combine original leading spaces with collapsed content
                 if collapsed:
-                    processed_segments.append(original_leading + collapsed)
+                    line = original_leading + collapsed
                 elif original_leading:
                     # Blank line with just spaces
-                    processed_segments.append(original_leading.rstrip())
+                    line = original_leading.rstrip()
                 else:
                     # Completely empty line
-                    processed_segments.append('')
+                    line = ''
+
+                # Remove double spaces (but not at line beginnings - that's indentation)
+                # Lines never end in spaces here, so there is no trailing space to strip
+                if '  ' in line:
+                    match = _LEADING_WS_RE.match(line)
+                    if match:
+                        line = match.group(1) + _DOUBLE_SPACE_RE.sub(' ', match.group(2))
+                processed_segments.append(line)
 
             # Join segments with actual newlines (where <br> tags were)
             text = '\n'.join(processed_segments)
         else:
             # For other tags: normalize all whitespace
-            text = re.sub(r'[ \t]+', ' ', text)  # Collapse horizontal whitespace
-            text = re.sub(r'\n[ \t]*', ' ', text)  # Replace newlines with space
-
-        # Clean up: remove only TRAILING spaces before newlines
-        # Don't remove leading spaces after newlines (that's indentation!)
-        text = re.sub(r' +\n', '\n', text)
-
-        # Remove double spaces (but not at line beginnings - that's indentation)
-        # Only collapse multiple spaces in the middle of lines
-        lines = text.split('\n')
-        cleaned_lines = []
-        for line in lines:
-            # Match leading whitespace separately
-            match = re.match(r'^([ \t]*)(.*)', line)
-            if match:
-                leading = match.group(1)
-                rest = match.group(2)
-                # Collapse multiple spaces in the content part only
-                rest = re.sub(r' {2,}', ' ', rest)
-                cleaned_lines.append(leading + rest)
-            else:
-                cleaned_lines.append(line)
-        text = '\n'.join(cleaned_lines)
+            text = _HORIZONTAL_WS_RE.sub(' ', text)  # Collapse horizontal whitespace
+            text = _NEWLINE_INDENT_RE.sub(' ', text)  # Replace newlines with space
 
-        # Normalize non-breaking spaces to regular spaces for code output
-        # This makes the output more standard and easier to work with
-        text = text.replace('\xa0', ' ')
-
-        # Replace any remaining LINEBREAK markers with actual newlines
-        # This ensures markers are removed even if they weren't processed by the preserve_newlines branch
-        text = text.replace(LINEBREAK_MARKER, '\n')
+            # Joining lines can leave double spaces; collapse them after the indentation
+            match = _LEADING_WS_RE.match(text)
+            if match:
+                text = match.group(1) + _DOUBLE_SPACE_RE.sub(' ', match.group(2))
 
-        # Only strip trailing whitespace - preserve leading indentation
-        text = text.rstrip()
-        # But also strip leading newlines (not spaces - that's indentation!)
-        while text.startswith('\n'):
-            text = text[1:]
+        # Normalize non-breaking spaces to regular spaces for code output, and
+        # replace any remaining LINEBREAK markers (from <pre> blocks) with newlines
+        text = text.replace('\xa0', ' ').replace(LINEBREAK_MARKER, '\n')
 
-        return text
+        # Only strip trailing whitespace and leading newlines - preserve leading indentation
+        return text.rstrip().lstrip('\n')
 
     def get_relative_path(self, file_path: Path) -> str:
         """
@@ -294,7 +323,12 @@ class ExampleParser:
         Returns:
             Relative path (e.g., 'sldworksapi/Example.htm')
         """
-        return str(file_path.relative_to(self.html_dir)).replace('\\', '/')
+        path = str(file_path)
+        if path.startswith(self._html_dir_prefix):
+            relative = path[len(self._html_dir_prefix):]
+        else:
+            relative = str(file_path.relative_to(self.html_dir))
+        return relative.replace('\\', '/')
 
     def parse_all_examples(self) -> ET.Element:
         """
@@ -307,14 +341,50 @@ class ExampleParser:
         root = ET.Element('Examples')
 
         # Find all HTML files
-        html_files = sorted(self.html_dir.rglob('*.htm'))
+        html_files = sorted(Path(entry.path) for entry in iter_example_files(self.html_dir))
         self.stats['total_files'] = len(html_files)
 
         print(f"Found {len(html_files)} HTML files to parse...")
 
-        for html_file in html_files:
-            # Parse the file
-            content = self.parse_html_file(html_file)
+        # Parse files across worker processes; imap keeps results in input order.
+        # The pool is terminated if anything below raises
+        with ExitStack() as stack:
+            pool = stack.enter_context(multiprocessing.Pool(self.workers)) if self.workers > 1 else None
+            results: Iterator[Tuple[Optional[str], List[Dict[str, str]]]]
+            if pool is not None:
+                results = pool.imap(_parse_one, html_files, chunksize=32)
+            else:
+                results = map(_parse_one, html_files)
+
+            self._add_examples(root, html_files, results)
+
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        print(f"\nParsing complete!")
+        print(f"  Successful: {self.stats['successful']}")
+        print(f"  Failed: {self.stats['failed']}")
+        print(f"  Empty content: {self.stats['empty_content']}")
+
+        return root
+
+    def _add_examples(
+        self,
+        root: ET.Element,
+        html_files: List[Path],
+        results: Iterator[Tuple[Optional[str], List[Dict[str, str]]]],
+    ) -> None:
+        """
+        Add an Example element to root for each parsed file.
+
+        Args:
+            root: Root XML element
+            html_files: HTML files in the order they were parsed
+            results: (content, errors) for each file in html_files
+        """
+        for html_file, (content, errors) in zip(html_files, results, strict=True):
+            self.errors.extend(errors)
 
             if content is None:
                 self.stats['failed'] += 1
@@ -345,61 +415,42 @@ class ExampleParser:
             if self.stats['successful'] % 100 == 0:
                 print(f"Processed {self.stats['successful']}/{len(html_files)} files...")
 
-        print(f"\nParsing complete!")
-        print(f"  Successful: {self.stats['successful']}")
-        print(f"  Failed: {self.stats['failed']}")
-        print(f"  Empty content: {self.stats['empty_content']}")
-
-        return root
-
     def _prettify_xml(self, elem: ET.Element) -> str:
         """
         Return a pretty-printed XML string with CDATA sections.
 
+        The document is assembled directly from the Example elements, so the
+        tree is never serialized and re-parsed just to indent it.
+
         Args:
             elem: Root XML element
 
         Returns:
             Formatted XML string
         """
-        # Convert to string
-        rough_string = ET.tostring(elem, encoding='unicode')
-
-        # Parse with minidom for pretty printing
-        reparsed = minidom.parseString(rough_string)
-
-        # Get pretty XML
-        pretty_xml = reparsed.toprettyxml(indent='    ', encoding='utf-8').decode('utf-8')
-
-        # Wrap Content text in CDATA
-        # Replace <Content>...</Content> with <Content><![CDATA[...]]></Content>
-        import re
-
-        def wrap_cdata(match):
-            content = match.group(1)
-            # Unescape XML entities since we're putting in CDATA
-            content = (content
-                       .replace('&lt;', '<')
-                       .replace('&gt;', '>')
-                       .replace('&quot;', '"')
-                       .replace('&apos;', "'")
-                       .replace('&amp;', '&'))  # Must be last
-            return f'<Content><![CDATA[\n{content}\n        ]]></Content>'
-
-        # Match Content elements and wrap their text in CDATA
-        pretty_xml = re.sub(
-            r'<Content>(.*?)</Content>',
-            wrap_cdata,
-            pretty_xml,
-            flags=re.DOTALL
-        )
-
-        # Remove extra blank lines
-        lines = pretty_xml.split('\n')
-        lines = [line for line in lines if line.strip() or line.startswith('<?xml')]
-        pretty_xml = '\n'.join(lines)
-
-        return pretty_xml
+        examples = elem.findall('Example')
+        if not examples:
+            return '<?xml version="1.0" encoding="utf-8"?>\n<Examples/>'
+
+        parts = ['<?xml version="1.0" encoding="utf-8"?>', '<Examples>']
+        for example in examples:
+            url = example.findtext('Url', '')
+            content = example.findtext('Content', '')
+
+            # Blank lines are dropped from the output, and a literal ]]> is
+            # split across two CDATA sections so it cannot end the first one early
+            content = '\n'.join(line for line in content.split('\n') if line.strip())
+            content = content.replace(']]>', ']]]]><![CDATA[>')
+
+            parts.append(
+                '    <Example>\n'
+                f'        <Url>{escape(url, _QUOTE_ENTITY)}</Url>\n'
+                f'        <Content><![CDATA[\n{content}\n        ]]></Content>\n'
+                '    </Example>'
+            )
+        parts.append('</Examples>')
+
+        return '\n'.join(parts)
 
     def save_xml(self, root: ET.Element) -> None:
         """
@@ -414,16 +465,19 @@ class ExampleParser:
         # Get pretty XML with CDATA
         xml_string = self._prettify_xml(root)
 
+        # Encode once (translating newlines as a text-mode write would) so the
+        # size and hash come from the written bytes instead of re-reading the file
+        xml_bytes = xml_string.replace('\n', os.linesep).encode('utf-8')
+
         # Save to file
-        with open(self.output_file, 'w', encoding='utf-8') as f:
-            f.write(xml_string)
+        with open(self.output_file, 'wb') as f:
+            f.write(xml_bytes)
 
         print(f"\nXML saved to: {self.output_file}")
 
         # Calculate file size and hash
-        file_size = os.path.getsize(self.output_file)
-        with open(self.output_file, 'rb') as f:
-            file_hash = hashlib.sha256(f.read()).hexdigest()
+        file_size = len(xml_bytes)
+        file_hash = hashlib.sha256(xml_bytes).hexdigest()
 
         print(f"File size: {file_size:,} bytes")
         print(f"SHA-256: {file_hash}")
@@ -447,7 +501,8 @@ class ExampleParser:
         if self.errors:
             errors_file = metadata_dir / 'parse_errors.json'
             with open(errors_file, 'w') as f:
-                json.dump(self.errors, f, indent=2)
+                # Compact, and encoded in one call, since the error list can be long
+                f.write(json.dumps(self.errors, separators=(',', ':')))
             print(f"Errors saved to: {errors_file}")
 
         # Save manifest
@@ -491,6 +546,24 @@ class ExampleParser:
         print("=" * 60)
 
 
+def _parse_one(file_path: Path) -> Tuple[Optional[str], List[Dict[str, str]]]:
+    """
+    Parse a single HTML file in a worker process.
+
+    Only the path is sent to the worker, so each call uses a fresh parser
+    and returns the errors it recorded alongside the content.
+
+    Args:
+        file_path: Path to HTML file
+
+    Returns:
+        Tuple of (formatted content or None, errors recorded for this file)
+    """
+    parser = ExampleParser(file_path.parent, file_path)
+    content = parser.parse_html_file(file_path)
+    return content, parser.errors
+
+
 def main():
     """Main entry point."""
     # Get project root
@@ -501,7 +574,7 @@ def main():
     output_file = project_root / '80_parse_examples' / 'output' / 'examples.xml'
 
     # Create parser and run
-    parser = ExampleParser(html_dir, output_file)
+    parser = ExampleParser(html_dir, output_file, workers=os.cpu_count() or 1)
     parser.run()
 
 
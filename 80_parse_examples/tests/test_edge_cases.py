@@ -4,7 +4,6 @@ Tests for specific HTML patterns found in the SolidWorks documentation.
 """
 
 import pytest
-import tempfile
 from pathlib import Path
 import xml.etree.ElementTree as ET
 import sys
@@ -15,24 +14,26 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from parse_examples import ExampleParser
 
 
+@pytest.fixture
+def temp_dirs(tmp_path):
+    """Create temporary directories for testing."""
+    html_path = tmp_path / 'html'
+    html_path.mkdir()
+    output_path = tmp_path / 'output' / 'test_output.xml'
+    output_path.parent.mkdir()
+    return html_path, output_path
+
+
+@pytest.fixture
+def parser(temp_dirs):
+    """Create a parser instance."""
+    html_dir, output_file = temp_dirs
+    return ExampleParser(html_dir, output_file)
+
+
 class TestPreFormattedBlocks:
     """Tests for <pre> tag handling."""
 
-    @pytest.fixture
-    def temp_dirs(self):
-        """Create temporary directories for testing."""
-        with tempfile.TemporaryDirectory() as html_dir, \
-             tempfile.TemporaryDirectory() as output_dir:
-            html_path = Path(html_dir)
-            output_path = Path(output_dir) / 'test_output.xml'
-            yield html_path, output_path
-
-    @pytest.fixture
-    def parser(self, temp_dirs):
-        """Create a parser instance."""
-        html_dir, output_file = temp_dirs
-        return ExampleParser(html_dir, output_file)
-
     def test_pre_block_preserves_newlines(self, parser, temp_dirs):
         """Test that <pre> blocks preserve actual newlines from HTML source."""
         html_dir, _ = temp_dirs
@@ -98,21 +99,6 @@ End Sub</pre>
 class TestIndentationPreservation:
     """Tests for preserving code indentation."""
 
-    @pytest.fixture
-    def temp_dirs(self):
-        """Create temporary directories for testing."""
-        with tempfile.TemporaryDirectory() as html_dir, \
-             tempfile.TemporaryDirectory() as output_dir:
-            html_path = Path(html_dir)
-            output_path = Path(output_dir) / 'test_output.xml'
-            yield html_path, output_path
-
-    @pytest.fixture
-    def parser(self, temp_dirs):
-        """Create a parser instance."""
-        html_dir, output_file = temp_dirs
-        return ExampleParser(html_dir, output_file)
-
     def test_apicode_with_nbsp_indentation(self, parser, temp_dirs):
         """Test that &nbsp; indentation in APICODE paragraphs is preserved."""
         html_dir, _ = temp_dirs
@@ -199,21 +185,6 @@ End Sub</pre>
 class TestMultiParagraphAPICode:
     """Tests for multiple <p class="APICODE"> paragraphs with indentation."""
 
-    @pytest.fixture
-    def temp_dirs(self):
-        """Create temporary directories for testing."""
-        with tempfile.TemporaryDirectory() as html_dir, \
-             tempfile.TemporaryDirectory() as output_dir:
-            html_path = Path(html_dir)
-            output_path = Path(output_dir) / 'test_output.xml'
-            yield html_path, output_path
-
-    @pytest.fixture
-    def parser(self, temp_dirs):
-        """Create a parser instance."""
-        html_dir, output_file = temp_dirs
-        return ExampleParser(html_dir, output_file)
-
     def test_multiple_apicode_paragraphs_preserve_indentation(self, parser, temp_dirs):
         """Test that indentation is preserved across multiple APICODE paragraphs."""
         html_dir, _ = temp_dirs
@@ -278,21 +249,6 @@ class TestMultiParagraphAPICode:
 class TestAPICodeParagraphs:
     """Tests for <p class="APICODE"> handling."""
 
-    @pytest.fixture
-    def temp_dirs(self):
-        """Create temporary directories for testing."""
-        with tempfile.TemporaryDirectory() as html_dir, \
-             tempfile.TemporaryDirectory() as output_dir:
-            html_path = Path(html_dir)
-            output_path = Path(output_dir) / 'test_output.xml'
-            yield html_path, output_path
-
-    @pytest.fixture
-    def parser(self, temp_dirs):
-        """Create a parser instance."""
-        html_dir, output_file = temp_dirs
-        return ExampleParser(html_dir, output_file)
-
     def test_apicode_with_br_tags(self, parser, temp_dirs):
         """Test that <br> tags in APICODE create line breaks."""
         html_dir, _ = temp_dirs
@@ -347,24 +303,40 @@ class TestAPICodeParagraphs:
         assert 'namespace Test' in content
 
 
+class TestNestedBlockElements:
+    """Tests for block elements nested in unclosed or enclosing <p> tags."""
+
+    def test_div_inside_paragraph_keeps_text(self, parser, temp_dirs):
+        """Test that a monospace div inside a <p> keeps its text in the paragraph."""
+        html_dir, _ = temp_dirs
+
+        test_file = html_dir / 'test_nested_div.htm'
+        test_file.write_text('<p>See <div style="font-family: Monospace">code here</div> after</p>')
+
+        content = parser.parse_html_file(test_file)
+
+        assert content == 'See code here after'
+
+    def test_unclosed_paragraphs(self, parser, temp_dirs):
+        """Test that runs of unclosed <p> tags keep every paragraph in order."""
+        html_dir, _ = temp_dirs
+
+        html_unclosed = """<h1>Test</h1>
+<p>First paragraph
+<p>Second paragraph
+<p class="APICODE">Dim x</p>"""
+
+        test_file = html_dir / 'test_unclosed.htm'
+        test_file.write_text(html_unclosed)
+
+        content = parser.parse_html_file(test_file)
+
+        assert content == 'Test\nFirst paragraph\nSecond paragraph\nDim x'
+
+
 class TestWhitespaceNormalization:
     """Tests for whitespace handling edge cases."""
 
-    @pytest.fixture
-    def temp_dirs(self):
-        """Create temporary directories for testing."""
-        with tempfile.TemporaryDirectory() as html_dir, \
-             tempfile.TemporaryDirectory() as output_dir:
-            html_path = Path(html_dir)
-            output_path = Path(output_dir) / 'test_output.xml'
-            yield html_path, output_path
-
-    @pytest.fixture
-    def parser(self, temp_dirs):
-        """Create a parser instance."""
-        html_dir, output_file = temp_dirs
-        return ExampleParser(html_dir, output_file)
-
     def test_no_excessive_blank_lines(self, parser, temp_dirs):
         """Test that excessive blank lines are collapsed."""
         html_dir, _ = temp_dirs
@@ -418,21 +390,6 @@ Code line 3</pre>
 class TestXMLGeneration:
     """Tests for XML output generation."""
 
-    @pytest.fixture
-    def temp_dirs(self):
-        """Create temporary directories for testing."""
-        with tempfile.TemporaryDirectory() as html_dir, \
-             tempfile.TemporaryDirectory() as output_dir:
-            html_path = Path(html_dir)
-            output_path = Path(output_dir) / 'test_output.xml'
-            yield html_path, output_path
-
-    @pytest.fixture
-    def parser(self, temp_dirs):
-        """Create a parser instance."""
-        html_dir, output_file = temp_dirs
-        return ExampleParser(html_dir, output_file)
-
     def test_cdata_contains_code_tags(self, parser, temp_dirs):
         """Test that <code> tags are inside CDATA, not escaped."""
         html_dir, output_file = temp_dirs
@@ -496,6 +453,28 @@ End If</pre>
         assert '&' in content
         assert '"' in content
 
+    def test_cdata_end_marker_in_content(self, parser, temp_dirs):
+        """Test that a literal ]]> in the content still produces valid XML."""
+        html_dir, output_file = temp_dirs
+
+        html = """
+        <h1>Test</h1>
+        <pre>Dim value = items(index(0))]]>
+End Sub</pre>
+        """
+
+        test_file = html_dir / 'test_cdata_end.htm'
+        test_file.write_text(html)
+
+        root = parser.parse_all_examples()
+        parser.save_xml(root)
+
+        tree = ET.parse(output_file)
+        content = tree.getroot().find('Example').find('Content').text
+
+        assert 'items(index(0))]]>' in content
+        assert 'End Sub' in content
+
     def test_nested_directories_in_url(self, parser, temp_dirs):
         """Test that nested directory structures are preserved in URLs."""
         html_dir, _ = temp_dirs
@@ -175,6 +175,26 @@ class TestExampleParser:
         assert parser.stats['successful'] == 3
         assert parser.stats['failed'] == 0
 
+    def test_parse_all_examples_with_workers(self, sample_html_simple, temp_dirs):
+        """Test parsing in worker processes matches the serial results."""
+        html_dir, output_file = temp_dirs
+
+        for i in range(5):
+            test_file = html_dir / f'example_{i}.htm'
+            test_file.write_text(f'<h1>Example {i}</h1>' + sample_html_simple)
+        (html_dir / 'bad.htm').write_bytes(b'<h1>\xff</h1>')
+
+        serial = ExampleParser(html_dir, output_file)
+        parallel = ExampleParser(html_dir, output_file, workers=2)
+
+        serial_root = serial.parse_all_examples()
+        parallel_root = parallel.parse_all_examples()
+
+        assert ET.tostring(parallel_root) == ET.tostring(serial_root)
+        assert parallel.stats == serial.stats
+        assert parallel.errors == serial.errors
+        assert len(parallel.errors) == 1
+
     def test_xml_structure(self, parser, sample_html_simple, temp_dirs):
         """Test XML structure is correct."""
         html_dir, _ = temp_dirs
@@ -219,6 +239,20 @@ class TestExampleParser:
         # Should return None for empty content
         assert content is None or len(content.strip()) == 0
 
+    def test_html_without_content_tags(self, parser, temp_dirs):
+        """Test that files without any content tags are skipped."""
+        html_dir, _ = temp_dirs
+
+        test_file = html_dir / 'no_tags.htm'
+        test_file.write_text('<span>Only inline text</span><table><tr><td>cell</td></tr></table>')
+
+        assert parser.parse_html_file(test_file) is None
+        assert len(parser.errors) == 0
+
+        # Tag names are matched case-insensitively
+        test_file.write_text('<P>Upper case paragraph</P>')
+        assert parser.parse_html_file(test_file) == 'Upper case paragraph'
+
     def test_html_entity_decoding(self, parser, temp_dirs):
         """Test that HTML entities are properly decoded."""
         html_dir, _ = temp_dirs
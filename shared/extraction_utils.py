@@ -6,12 +6,19 @@ This module provides common functions for parsing SolidWorks API HTML
 documentation and generating XML output.
 """
 
+import html as html_module
 import re
 import xml.dom.minidom as minidom
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Any
 
+# Elements marked with __cdata__="true" by the XML builders
+# Matches: <Description __cdata__="true">content</Description>
+#      or: <Remarks __cdata__="true">content</Remarks>
+#      or: <Returns __cdata__="true">content</Returns>
+_CDATA_MARKER_RE = re.compile(r'<(Description|Remarks|Returns) __cdata__="true">(.*?)</\1>', re.DOTALL)
+
 
 def extract_namespace_from_filename(html_file: Path) -> tuple[str | None, str | None, str | None]:
     """
@@ -98,13 +105,6 @@ def wrap_cdata_sections(xml_str: str) -> str:
     This is a post-processing step since ElementTree doesn't natively support CDATA.
     Handles Description, Remarks, and Returns elements.
     """
-    import html as html_module
-
-    # Pattern to find elements marked with __cdata__="true"
-    # Matches: <Description __cdata__="true">content</Description>
-    #      or: <Remarks __cdata__="true">content</Remarks>
-    #      or: <Returns __cdata__="true">content</Returns>
-    pattern = r'<(Description|Remarks|Returns) __cdata__="true">(.*?)</\1>'
 
     def replace_with_cdata(match: re.Match[str]) -> str:
         tag_name = match.group(1)
@@ -113,7 +113,7 @@ def wrap_cdata_sections(xml_str: str) -> str:
         content = html_module.unescape(content)
         return f"<{tag_name}><![CDATA[{content}]]></{tag_name}>"
 
-    return re.sub(pattern, replace_with_cdata, xml_str, flags=re.DOTALL)
+    return _CDATA_MARKER_RE.sub(replace_with_cdata, xml_str)
 
 
 def prettify_xml(root: ET.Element) -> str:
@@ -169,7 +169,17 @@ def is_member_file(html_file: Path) -> bool:
 
     Member files have format: Assembly~Namespace.Type~Member.html
     """
-    filename = html_file.name.lower()
+    return is_member_file_name(html_file.name)
+
+
+def is_member_file_name(name: str) -> bool:
+    """
+    Check if a bare file name is a member file name.
+
+    Same check as is_member_file, for directory walks that have the name as a
+    string and only need a Path for the files that are kept.
+    """
+    filename = name.lower()
 
     # Exclude special files
     if filename.startswith("functionalcategories") or filename.startswith("releasenotes"):
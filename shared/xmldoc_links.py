@@ -8,6 +8,11 @@ and <see href> tags for IntelliSense documentation.
 
 import re
 
+# Anchor tags with a .htm/.html href: <a href="Assembly~Namespace.Type~Member.html">LinkText</a>
+_ANCHOR_RE = re.compile(r'<a\s+[^>]*?href="([^"]+?\.html?)"[^>]*?>([^<]+?)</a>')
+# Any remaining HTML tag other than <see ...> and </see>
+_NON_SEE_TAG_RE = re.compile(r"<(?!/?see[\s>])[^>]+>")
+
 
 def convert_links_to_see_refs(html: str) -> str:
     """
@@ -23,10 +28,6 @@ def convert_links_to_see_refs(html: str) -> str:
     becomes:
     <see href="https://help.solidworks.com/2026/english/api/sldworksapiprogguide//Overview/SOLIDWORKS_Connected.htm">SOLIDWORKS Design</see>
     """
-    # Pattern to match anchor tags with SolidWorks API links
-    # Matches: <a href="Assembly~Namespace.Type~Member.html">LinkText</a>
-    # Or: <a href="Assembly~Namespace.Type.html">LinkText</a>
-    pattern = r'<a\s+[^>]*?href="([^"]+?\.html?)"[^>]*?>([^<]+?)</a>'
 
     def replace_link(match: re.Match[str]) -> str:
         href = match.group(1)
@@ -51,7 +52,7 @@ def convert_links_to_see_refs(html: str) -> str:
             full_url = convert_to_full_url(href)
             return f'{prefix}<see href="{full_url}">{clean_text}</see>{suffix}'
 
-    result = re.sub(pattern, replace_link, html)
+    result = _ANCHOR_RE.sub(replace_link, html)
 
     # Clean up HTML entities
     result = result.replace("&nbsp;", " ")
@@ -61,7 +62,7 @@ def convert_links_to_see_refs(html: str) -> str:
 
     # Clean up remaining HTML tags (like <p>, <div>, etc.)
     # Keep <see cref="..."> and </see> tags
-    result = re.sub(r"<(?!/?see[\s>])[^>]+>", "", result)
+    result = _NON_SEE_TAG_RE.sub("", result)
 
     return result.strip()
 